@@ -5,11 +5,18 @@ Connects DALS (Distributed AI Learning System) to Dual Core Caleon.
 Handles DALS-specific message formats and integration patterns.
 """
 
-import aiohttp
-import json
+import asyncio
+import httpx
+import orjson
 import logging
-from typing import Dict, Any, Optional
-from connection_spine import CaleonAdapter
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+from connection_spine import CaleonAdapter, JSON_HEADERS, TRANSPORT_ERRORS, get_session, release_session
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Fall back to per-pattern substring scan
 
 logger = logging.getLogger("dals_adapter")
 
@@ -31,14 +38,32 @@ class DalsAdapter(CaleonAdapter):
         self.node_id = self.config.get("node_id", "caleon_node_1")
         self.cluster_id = self.config.get("cluster_id", "default_cluster")
 
-        # Learning context
-        self.learning_context = {}
+        # Learning context (LRU order - most recently used last)
+        self.learning_context: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_learning_context = self.config.get("max_learning_context", 100)
+        self._lower_patterns: Dict[str, str] = {}
+        self._last_msg_lower = ("", "")
         self.session = None
 
+        # Pattern automaton over learning_context keys, rebuilt lazily
+        self._pattern_ac = None
+        self._ac_dirty = True
+
+        # Per-connection request templates, built in connect()
+        self._ctx_template: Dict[str, Any] = {}
+        self._auth_headers: Dict[str, str] = {}
+
+        # Learning distribution batching
+        self.dist_batch_ms = self.config.get("dist_batch_ms", 20)
+        self.dist_batch_max = self.config.get("dist_batch_max", 64)
+        self._dist_queue = asyncio.Queue(maxsize=1000)
+        self._dist_batch_task = None
+
     async def connect(self) -> bool:
         """Establish connection to Caleon Port via DALS coordinator"""
         try:
-            self.session = aiohttp.ClientSession()
+            if self.session is None:
+                self.session = await get_session()
 
             # Register with DALS coordinator
             reg_data = {
@@ -48,14 +73,6 @@ class DalsAdapter(CaleonAdapter):
                 "caleon_integration": True
             }
 
-            async with self.session.post(
-                f"{self.dals_coordinator_url}/nodes/register",
-                json=reg_data
-            ) as response:
-                if response.status != 200:
-                    logger.error(f"DALS coordinator registration failed: {response.status}")
-                    return False
-
             # Connect to Caleon Port
             connect_data = {
                 "client": "DALS",
@@ -64,20 +81,52 @@ class DalsAdapter(CaleonAdapter):
                 "capabilities": ["text", "voice", "memory", "reasoning", "distributed_learning"]
             }
 
-            async with self.session.post(
-                f"{self.caleon_port_url}/api/v1/connect",
-                json=connect_data
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    self.session_id = result.get("session_id")
-                    self.connected = True
-                    logger.info(f"DALS adapter connected - Node: {self.node_id}, Session: {self.session_id}")
-                    return True
+            # Registration and Caleon connect are independent - issue both at once
+            reg_response, response = await asyncio.gather(
+                self.session.post(
+                    f"{self.dals_coordinator_url}/nodes/register",
+                    content=orjson.dumps(reg_data),
+                    headers=JSON_HEADERS
+                ),
+                self.session.post(
+                    f"{self.caleon_port_url}/api/v1/connect",
+                    content=orjson.dumps(connect_data),
+                    headers=JSON_HEADERS
+                ),
+                return_exceptions=True
+            )
+
+            if isinstance(reg_response, BaseException) or reg_response.status_code != 200:
+                if isinstance(reg_response, BaseException):
+                    logger.error(f"DALS coordinator registration error: {reg_response}")
                 else:
-                    error = await response.text()
-                    logger.error(f"DALS Caleon connection failed: {error}")
-                    return False
+                    logger.error(f"DALS coordinator registration failed: {reg_response.status_code}")
+                # Don't leave an orphaned Caleon session behind
+                if not isinstance(response, BaseException) and response.status_code == 200:
+                    await self._drop_caleon_session(response)
+                return False
+
+            if isinstance(response, BaseException):
+                raise response
+
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                self.session_id = result.get("session_id")
+                self._ctx_template = {
+                    "platform": "DALS",
+                    "node_id": self.node_id,
+                    "cluster_id": self.cluster_id,
+                    "distributed_processing": True
+                }
+                self._auth_headers = {**JSON_HEADERS, "Authorization": f"Bearer {self.auth_token}"}
+                self.connected = True
+                if self._dist_batch_task is None:
+                    self._dist_batch_task = asyncio.create_task(self._dist_flusher())
+                logger.info(f"DALS adapter connected - Node: {self.node_id}, Session: {self.session_id}")
+                return True
+            else:
+                logger.error(f"DALS Caleon connection failed: {response.text}")
+                return False
 
         except Exception as e:
             logger.error(f"DALS connection error: {e}")
@@ -86,26 +135,20 @@ class DalsAdapter(CaleonAdapter):
     async def disconnect(self) -> bool:
         """Disconnect from Caleon Port and DALS coordinator"""
         try:
-            # Disconnect from Caleon
-            if self.session and self.session_id:
-                async with self.session.delete(
-                    f"{self.caleon_port_url}/api/v1/connect/{self.session_id}"
-                ) as response:
-                    pass  # Log if needed
-
-            # Unregister from DALS coordinator
-            try:
-                async with self.session.post(
-                    f"{self.dals_coordinator_url}/nodes/unregister",
-                    json={"node_id": self.node_id}
-                ) as response:
-                    pass
-            except:
-                pass  # DALS coordinator might be unavailable
+            # Flush pending learning updates before tearing down
+            task, self._dist_batch_task = self._dist_batch_task, None
+            if task is not None:
+                await self._stop_dist_flusher(task)
 
             if self.session:
-                await self.session.close()
+                # Leave Caleon and the DALS coordinator concurrently
+                async with asyncio.TaskGroup() as tg:
+                    if self.session_id:
+                        tg.create_task(self._disconnect_caleon())
+                    tg.create_task(self._unregister_node())
+
                 self.session = None
+                await release_session()
 
             self.connected = False
             self.session_id = None
@@ -116,75 +159,105 @@ class DalsAdapter(CaleonAdapter):
             logger.error(f"DALS disconnect error: {e}")
             return False
 
+    async def _stop_dist_flusher(self, task: asyncio.Task):
+        """Let the learning flusher drain and exit; tolerate one that already died"""
+        if not task.done():
+            try:
+                self._dist_queue.put_nowait(None)
+            except asyncio.QueueFull:
+                await self._dist_queue.put(None)  # a live flusher frees a slot
+        try:
+            await task
+        except Exception as e:
+            logger.warning(f"DALS learning flusher stopped with error: {e}")
+
+    async def _drop_caleon_session(self, response):
+        """Close a Caleon Port session opened by a connect() that then failed"""
+        try:
+            session_id = orjson.loads(response.content).get("session_id")
+            if session_id:
+                await self.session.delete(f"{self.caleon_port_url}/api/v1/connect/{session_id}")
+        except Exception as e:
+            logger.warning(f"DALS orphaned Caleon session cleanup error: {e}")
+
+    async def _disconnect_caleon(self):
+        """Close this node's Caleon Port session"""
+        try:
+            await self.session.delete(
+                f"{self.caleon_port_url}/api/v1/connect/{self.session_id}"
+            )
+        except TRANSPORT_ERRORS as e:
+            logger.warning(f"DALS Caleon disconnect error: {e}")
+
+    async def _unregister_node(self):
+        """Unregister this node from the DALS coordinator"""
+        try:
+            await self.session.post(
+                f"{self.dals_coordinator_url}/nodes/unregister",
+                content=orjson.dumps({"node_id": self.node_id}),
+                headers=JSON_HEADERS
+            )
+        except TRANSPORT_ERRORS:
+            pass  # DALS coordinator might be unavailable
+
     async def send_message(self, message: str, **kwargs) -> Dict[str, Any]:
         """Send message to Caleon with DALS learning context"""
         if not self.connected:
             raise ConnectionError("DALS adapter not connected")
 
-        try:
-            # Enhance message with DALS learning context
-            enhanced_message = self._enhance_with_learning_context(message, **kwargs)
+        # Enhance message with DALS learning context
+        enhanced_message = self._enhance_with_learning_context(message, **kwargs)
 
-            caleon_request = {
-                "message": enhanced_message,
-                "context": {
-                    "platform": "DALS",
-                    "node_id": self.node_id,
-                    "cluster_id": self.cluster_id,
-                    "learning_context": self.learning_context,
-                    "distributed_processing": True
-                },
-                "priority": kwargs.get("priority", "normal"),
-                "timeout": kwargs.get("timeout", 45.0)  # Longer timeout for distributed processing
-            }
+        context = self._ctx_template.copy()
+        context["learning_context"] = self.learning_context
 
-            async with self.session.post(
-                f"{self.caleon_port_url}/api/v1/think",
-                json=caleon_request,
-                headers={"Authorization": f"Bearer {self.auth_token}"}
-            ) as response:
-
-                if response.status == 200:
-                    caleon_response = await response.json()
+        caleon_request = {
+            "message": enhanced_message,
+            "context": context,
+            "priority": kwargs.get("priority", "normal"),
+            "timeout": kwargs.get("timeout", 45.0)  # Longer timeout for distributed processing
+        }
 
-                    # Update learning context with response
-                    self._update_learning_context(caleon_response)
+        try:
+            response = await self.session.post(
+                f"{self.caleon_port_url}/api/v1/think",
+                content=orjson.dumps(caleon_request),
+                headers=self._auth_headers
+            )
+            if response.status_code != 200:
+                error = response.text
+                logger.error(f"DALS message send failed: {error}")
+                return {"error": f"HTTP {response.status_code}: {error}"}
+            # One C-level parse feeds both the caller and the learning update -
+            # the full body is returned, so a streaming parse would only add a pass
+            caleon_response = orjson.loads(response.content)
+        except TRANSPORT_ERRORS as e:
+            logger.error(f"DALS message send error: {e}")
+            return {"error": str(e)}
 
-                    # Distribute learning to DALS cluster
-                    await self._distribute_learning(caleon_response)
+        # Update learning context with response
+        self._update_learning_context(caleon_response)
 
-                    return caleon_response
-                else:
-                    error = await response.text()
-                    logger.error(f"DALS message send failed: {error}")
-                    return {"error": f"HTTP {response.status}: {error}"}
+        # Hand learning off to the DALS cluster flusher - never blocks the reply
+        self._distribute_learning(caleon_response)
 
-        except Exception as e:
-            logger.error(f"DALS message send error: {e}")
-            return {"error": str(e)}
+        return caleon_response
 
     async def receive_response(self, response: Dict[str, Any]) -> Any:
         """Process Caleon response and distribute to DALS cluster"""
-        try:
-            # Update local learning context
-            self._update_learning_context(response)
+        # Update local learning context
+        self._update_learning_context(response)
 
-            # Distribute to other DALS nodes
-            await self._distribute_learning(response)
+        # Distribute to other DALS nodes
+        self._distribute_learning(response)
 
-            # Format for DALS consumption
-            dals_formatted = {
-                "caleon_response": response,
-                "node_id": self.node_id,
-                "cluster_id": self.cluster_id,
-                "distributed": True
-            }
-
-            return dals_formatted
-
-        except Exception as e:
-            logger.error(f"DALS response processing error: {e}")
-            return {"error": str(e)}
+        # Format for DALS consumption
+        return {
+            "caleon_response": response,
+            "node_id": self.node_id,
+            "cluster_id": self.cluster_id,
+            "distributed": True
+        }
 
     def _enhance_with_learning_context(self, message: str, **kwargs) -> str:
         """Enhance message with accumulated learning context"""
@@ -193,84 +266,160 @@ class DalsAdapter(CaleonAdapter):
 
         if self.learning_context:
             # Extract relevant context based on message content
-            relevant_patterns = []
-            message_lower = message.lower()
+            if self._last_msg_lower[0] == message:
+                message_lower = self._last_msg_lower[1]
+            else:
+                message_lower = message.lower()
+                self._last_msg_lower = (message, message_lower)
+
+            if ahocorasick is not None:
+                if self._ac_dirty:
+                    self._rebuild_pattern_automaton()
+                hits = {}
+                for _, (pattern, data) in self._pattern_ac.iter(message_lower):
+                    hits.setdefault(pattern, data)
+                matches = hits.items()
+            else:
+                matches = [
+                    (pattern, self.learning_context[pattern])
+                    for pattern, lowered in self._lower_patterns.items()
+                    if lowered in message_lower
+                ]
 
-            for pattern, data in self.learning_context.items():
-                if pattern.lower() in message_lower:
-                    relevant_patterns.append(f"{pattern}: {data.get('confidence', 0):.2f}")
+            relevant_patterns = []
+            for pattern, data in list(matches)[:3]:
+                relevant_patterns.append(f"{pattern}: {data.get('confidence', 0):.2f}")
+                self.learning_context.move_to_end(pattern)
 
             if relevant_patterns:
                 context_str = f" [Learning Context: {', '.join(relevant_patterns[:3])}]"
 
         return message + context_str
 
+    def _rebuild_pattern_automaton(self):
+        """Compile learning_context keys into one Aho-Corasick automaton"""
+        automaton = ahocorasick.Automaton()
+        for pattern, data in self.learning_context.items():
+            automaton.add_word(self._lower_patterns[pattern], (pattern, data))
+        automaton.make_automaton()
+        self._pattern_ac = automaton
+        self._ac_dirty = False
+
     def _update_learning_context(self, response: Dict[str, Any]):
         """Update learning context from Caleon response"""
         try:
             reasoning = response.get("reasoning_chain", {})
-
-            # Extract patterns and confidence scores
-            for hemisphere, data in reasoning.items():
-                if isinstance(data, dict):
-                    verdict = data.get("synaptic_verdict")
-                    if verdict:
-                        # Store pattern with confidence
-                        confidence = response.get("confidence", 0.5)
-                        self.learning_context[verdict] = {
-                            "confidence": confidence,
-                            "hemisphere": hemisphere,
-                            "timestamp": response.get("unix", 0)
-                        }
-
-            # Limit context size
-            if len(self.learning_context) > 100:
-                # Remove oldest entries
-                sorted_items = sorted(
-                    self.learning_context.items(),
-                    key=lambda x: x[1]["timestamp"]
-                )
-                self.learning_context = dict(sorted_items[-50:])  # Keep 50 most recent
+            confidence = response.get("confidence", 0.5)
+            timestamp = response.get("unix", 0)
+
+            if len(reasoning) == 1:
+                # Common single-hemisphere shape - no loop needed
+                hemisphere, data = next(iter(reasoning.items()))
+                verdict = data.get("synaptic_verdict") if isinstance(data, dict) else None
+                if verdict:
+                    self._store_pattern(verdict, hemisphere, confidence, timestamp)
+            else:
+                # Extract patterns and confidence scores
+                for hemisphere, data in reasoning.items():
+                    if isinstance(data, dict):
+                        verdict = data.get("synaptic_verdict")
+                        if verdict:
+                            self._store_pattern(verdict, hemisphere, confidence, timestamp)
+
+            # Limit context size - evict least recently used entries
+            while len(self.learning_context) > self.max_learning_context:
+                evicted, _ = self.learning_context.popitem(last=False)
+                self._lower_patterns.pop(evicted, None)
+                self._ac_dirty = True
 
         except Exception as e:
             logger.warning(f"Learning context update failed: {e}")
 
-    async def _distribute_learning(self, response: Dict[str, Any]):
-        """Distribute learning updates to DALS cluster"""
-        try:
-            learning_update = {
-                "node_id": self.node_id,
-                "cluster_id": self.cluster_id,
-                "learning_data": {
-                    "caleon_response": response,
-                    "context_size": len(self.learning_context),
-                    "timestamp": response.get("unix", 0)
-                }
+    def _store_pattern(self, verdict: str, hemisphere: str, confidence: float, timestamp: Any):
+        """Store pattern with confidence as the most recent learning context entry"""
+        self.learning_context.pop(verdict, None)
+        self.learning_context[verdict] = {
+            "confidence": confidence,
+            "hemisphere": hemisphere,
+            "timestamp": timestamp
+        }
+        self._lower_patterns[verdict] = verdict.lower()
+        self._ac_dirty = True
+
+    def _distribute_learning(self, response: Dict[str, Any]):
+        """Queue a learning update for batched distribution to DALS cluster"""
+        learning_update = {
+            "node_id": self.node_id,
+            "cluster_id": self.cluster_id,
+            "learning_data": {
+                "caleon_response": response,
+                "context_size": len(self.learning_context),
+                "timestamp": response.get("unix", 0)
             }
+        }
 
-            async with self.session.post(
-                f"{self.dals_coordinator_url}/learning/distribute",
-                json=learning_update
-            ) as cluster_response:
-                if cluster_response.status == 200:
-                    logger.debug("Learning distributed to DALS cluster")
-                else:
-                    logger.warning(f"DALS learning distribution failed: {cluster_response.status}")
+        try:
+            self._dist_queue.put_nowait(learning_update)
+        except asyncio.QueueFull:
+            logger.warning("DALS learning queue full - update dropped")
+
+    async def _dist_flusher(self):
+        """Coalesce queued learning updates into batched cluster POSTs"""
+        loop = asyncio.get_running_loop()
+        window = self.dist_batch_ms / 1000
+        stopping = False
+
+        while not stopping:
+            update = await self._dist_queue.get()
+            if update is None:
+                break
+
+            # Collect more updates until the window closes or the batch fills
+            batch = [update]
+            deadline = loop.time() + window
+            while len(batch) < self.dist_batch_max:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    update = await asyncio.wait_for(self._dist_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if update is None:
+                    stopping = True
+                    break
+                batch.append(update)
+
+            await self._post_learning_batch(batch)
+
+    async def _post_learning_batch(self, batch: List[Dict[str, Any]]):
+        """Send one batch of learning updates to DALS cluster"""
+        try:
+            cluster_response = await self.session.post(
+                f"{self.dals_coordinator_url}/learning/distribute_batch",
+                content=orjson.dumps({"batch": batch}),
+                headers=JSON_HEADERS
+            )
+            if cluster_response.status_code == 200:
+                logger.debug(f"Learning batch of {len(batch)} distributed to DALS cluster")
+            else:
+                logger.warning(f"DALS learning distribution failed: {cluster_response.status_code}")
 
         except Exception as e:
-            logger.warning(f"DALS learning distribution error: {e}")
+            # Includes unserializable callback payloads - drop the batch, keep the flusher alive
+            logger.warning(f"DALS learning distribution error, batch of {len(batch)} dropped: {e}")
 
     async def get_cluster_status(self) -> Dict[str, Any]:
         """Get DALS cluster status"""
         try:
-            async with self.session.get(
+            response = await self.session.get(
                 f"{self.dals_coordinator_url}/cluster/status"
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    return {"error": f"Cluster status unavailable: {response.status}"}
-        except Exception as e:
+            )
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+            else:
+                return {"error": f"Cluster status unavailable: {response.status_code}"}
+        except TRANSPORT_ERRORS as e:
             return {"error": str(e)}
 
 # Factory function
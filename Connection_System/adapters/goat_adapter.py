@@ -6,11 +6,14 @@ This adapter handles GOAT-specific message formats, authentication,
 and response processing.
 """
 
-import aiohttp
-import json
+import asyncio
+import httpx
+import orjson
 import logging
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional
-from connection_spine import CaleonAdapter
+from connection_spine import CaleonAdapter, JSON_HEADERS, TRANSPORT_ERRORS, get_session, release_session
 
 logger = logging.getLogger("goat_adapter")
 
@@ -34,14 +37,29 @@ class GoatAdapter(CaleonAdapter):
         self.goat_client_secret = self.config.get("goat_client_secret", "")
         self.session_token = None
 
+        # Token refresh - re-auth this many seconds before expiry
+        self.token_refresh_margin = self.config.get("token_refresh_margin", 30)
+        self.token_retry_delay = self.config.get("token_retry_delay", 5)
+        self._token_expiry: Optional[float] = None
+        self._token_task = None
+
         # HTTP client session
         self.session = None
 
+        # Static GOAT context fields and auth headers (set once authenticated)
+        self._ctx_template = {"platform": "GOAT", "message_type": "user_input"}
+        self._auth_headers: Dict[str, str] = {}
+
+        # Converted responses keyed by cycle_id (LRU, most recent last)
+        self._goat_cache: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        self._goat_cache_size = 128
+
     async def connect(self) -> bool:
         """Establish connection to Caleon Port via GOAT"""
         try:
-            # Initialize HTTP session
-            self.session = aiohttp.ClientSession()
+            # Attach to the shared HTTP session
+            if self.session is None:
+                self.session = await get_session()
 
             # Perform GOAT authentication
             auth_success = await self._authenticate_goat()
@@ -57,20 +75,22 @@ class GoatAdapter(CaleonAdapter):
                 "capabilities": ["text", "voice", "memory", "reasoning", "goat_integration"]
             }
 
-            async with self.session.post(
+            response = await self.session.post(
                 f"{self.caleon_port_url}/api/v1/connect",
-                json=connect_data
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    self.session_id = result.get("session_id")
-                    self.connected = True
-                    logger.info(f"GOAT adapter connected - Session: {self.session_id}")
-                    return True
-                else:
-                    error = await response.text()
-                    logger.error(f"GOAT connection failed: {error}")
-                    return False
+                content=orjson.dumps(connect_data),
+                headers=JSON_HEADERS
+            )
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                self.session_id = result.get("session_id")
+                self.connected = True
+                if self._token_task is None and self._token_expiry is not None:
+                    self._token_task = asyncio.create_task(self._token_refresher())
+                logger.info(f"GOAT adapter connected - Session: {self.session_id}")
+                return True
+            else:
+                logger.error(f"GOAT connection failed: {response.text}")
+                return False
 
         except Exception as e:
             logger.error(f"GOAT connection error: {e}")
@@ -79,18 +99,22 @@ class GoatAdapter(CaleonAdapter):
     async def disconnect(self) -> bool:
         """Disconnect from Caleon Port"""
         try:
+            if self._token_task:
+                self._token_task.cancel()
+                self._token_task = None
+
             if self.session and self.session_id:
-                async with self.session.delete(
+                response = await self.session.delete(
                     f"{self.caleon_port_url}/api/v1/connect/{self.session_id}"
-                ) as response:
-                    if response.status == 200:
-                        logger.info("GOAT adapter disconnected")
-                    else:
-                        logger.warning("GOAT disconnect may not have completed cleanly")
+                )
+                if response.status_code == 200:
+                    logger.info("GOAT adapter disconnected")
+                else:
+                    logger.warning("GOAT disconnect may not have completed cleanly")
 
             if self.session:
-                await self.session.close()
                 self.session = None
+                await release_session()
 
             self.connected = False
             self.session_id = None
@@ -105,30 +129,27 @@ class GoatAdapter(CaleonAdapter):
         if not self.connected:
             raise ConnectionError("GOAT adapter not connected")
 
-        try:
-            # Convert GOAT message format to Caleon format
-            caleon_request = self._convert_goat_to_caleon(message, **kwargs)
+        # Convert GOAT message format to Caleon format
+        caleon_request = self._convert_goat_to_caleon(message, **kwargs)
 
-            async with self.session.post(
+        try:
+            response = await self.session.post(
                 f"{self.caleon_port_url}/api/v1/think",
-                json=caleon_request,
-                headers={"Authorization": f"Bearer {self.auth_token}"}
-            ) as response:
-
-                if response.status == 200:
-                    caleon_response = await response.json()
-                    # Convert Caleon response to GOAT format
-                    goat_response = self._convert_caleon_to_goat(caleon_response)
-                    return goat_response
-                else:
-                    error = await response.text()
-                    logger.error(f"GOAT message send failed: {error}")
-                    return {"error": f"HTTP {response.status}: {error}"}
-
-        except Exception as e:
+                content=orjson.dumps(caleon_request),
+                headers=self._auth_headers
+            )
+            if response.status_code != 200:
+                error = response.text
+                logger.error(f"GOAT message send failed: {error}")
+                return {"error": f"HTTP {response.status_code}: {error}"}
+            caleon_response = orjson.loads(response.content)
+        except TRANSPORT_ERRORS as e:
             logger.error(f"GOAT message send error: {e}")
             return {"error": str(e)}
 
+        # Convert Caleon response to GOAT format
+        return self._convert_caleon_to_goat(caleon_response)
+
     async def receive_response(self, response: Dict[str, Any]) -> Any:
         """Process response from Caleon (callback interface)"""
         # This method is called when responses come back through callbacks
@@ -150,24 +171,43 @@ class GoatAdapter(CaleonAdapter):
                 "grant_type": "client_credentials"
             }
 
-            async with aiohttp.ClientSession() as temp_session:
-                async with temp_session.post(
-                    f"{self.goat_api_url}/oauth/token",
-                    json=auth_data
-                ) as response:
-                    if response.status == 200:
-                        token_data = await response.json()
-                        self.session_token = token_data.get("access_token")
-                        self.auth_token = self.session_token  # Use for Caleon auth
-                        return True
-                    else:
-                        logger.error(f"GOAT auth failed: {response.status}")
-                        return False
+            response = await self.session.post(
+                f"{self.goat_api_url}/oauth/token",
+                content=orjson.dumps(auth_data),
+                headers=JSON_HEADERS
+            )
+            if response.status_code == 200:
+                token_data = orjson.loads(response.content)
+                self.session_token = token_data.get("access_token")
+                self.auth_token = self.session_token  # Use for Caleon auth
+                self._auth_headers = {**JSON_HEADERS, "Authorization": f"Bearer {self.auth_token}"}
+
+                expires_in = token_data.get("expires_in")
+                if expires_in:
+                    # Refresh `margin` early, but never sooner than half the lifetime (or 1s),
+                    # so a short-lived token can't drive the refresher into a tight loop
+                    refresh_in = max(expires_in - self.token_refresh_margin, expires_in / 2, 1.0)
+                    self._token_expiry = time.monotonic() + refresh_in
+                else:
+                    self._token_expiry = None
+                return True
+            else:
+                logger.error(f"GOAT auth failed: {response.status_code}")
+                return False
 
         except Exception as e:
             logger.error(f"GOAT authentication error: {e}")
             return False
 
+    async def _token_refresher(self):
+        """Re-authenticate with GOAT shortly before the session token expires"""
+        while self._token_expiry is not None:
+            await asyncio.sleep(max(0.0, self._token_expiry - time.monotonic()))
+            if await self._authenticate_goat():
+                logger.debug("GOAT session token refreshed")
+            else:
+                await asyncio.sleep(self.token_retry_delay)
+
     def _convert_goat_to_caleon(self, goat_message: str, **kwargs) -> Dict[str, Any]:
         """Convert GOAT message format to Caleon format"""
         # GOAT messages might have specific structure
@@ -178,11 +218,8 @@ class GoatAdapter(CaleonAdapter):
         priority = kwargs.get("priority", "normal")
 
         # Add GOAT-specific context
-        context.update({
-            "platform": "GOAT",
-            "message_type": "user_input",
-            "timestamp": kwargs.get("timestamp")
-        })
+        context.update(self._ctx_template)
+        context["timestamp"] = kwargs.get("timestamp")
 
         return {
             "message": message_content,
@@ -192,20 +229,36 @@ class GoatAdapter(CaleonAdapter):
         }
 
     def _convert_caleon_to_goat(self, caleon_response: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert Caleon response to GOAT format"""
-        # Transform Caleon's structured response to GOAT's expected format
-
+        """Convert Caleon response to GOAT format, reusing conversions per cycle_id"""
+        cycle_id = caleon_response.get("cycle_id")
+        if cycle_id is None:
+            return self._build_goat_response(caleon_response)
+
+        cached = self._goat_cache.get(cycle_id)
+        if cached is not None:
+            self._goat_cache.move_to_end(cycle_id)
+            return cached
+
+        goat_response = self._build_goat_response(caleon_response)
+        self._goat_cache[cycle_id] = goat_response
+        if len(self._goat_cache) > self._goat_cache_size:
+            self._goat_cache.popitem(last=False)
+        return goat_response
+
+    def _build_goat_response(self, caleon_response: Dict[str, Any]) -> Dict[str, Any]:
+        """Transform Caleon's structured response to GOAT's expected format"""
+        get = caleon_response.get  # bind once - seven lookups follow
         return {
             "goat_response": {
-                "message": caleon_response.get("final_verdict", ""),
+                "message": get("final_verdict", ""),
                 "metadata": {
-                    "cycle_id": caleon_response.get("cycle_id"),
-                    "stardate": caleon_response.get("stardate"),
-                    "confidence": caleon_response.get("confidence", 0.0),
-                    "processing_time": caleon_response.get("processing_time", 0.0)
+                    "cycle_id": get("cycle_id"),
+                    "stardate": get("stardate"),
+                    "confidence": get("confidence", 0.0),
+                    "processing_time": get("processing_time", 0.0)
                 },
-                "reasoning": caleon_response.get("reasoning_chain", {}),
-                "audio": caleon_response.get("audio_file"),
+                "reasoning": get("reasoning_chain", {}),
+                "audio": get("audio_file"),
                 "platform": "Caleon",
                 "version": "1.0.0"
             }
@@ -214,17 +267,25 @@ class GoatAdapter(CaleonAdapter):
     async def _forward_to_goat(self, goat_response: Dict[str, Any]):
         """Forward processed response back to GOAT system"""
         # Implementation depends on GOAT's callback/webhook system
+        # Example: POST back to GOAT webhook
+        webhook_url = self.config.get("goat_webhook_url")
+        if not webhook_url:
+            return
+
         try:
-            # Example: POST back to GOAT webhook
-            webhook_url = self.config.get("goat_webhook_url")
-            if webhook_url:
-                async with self.session.post(webhook_url, json=goat_response) as response:
-                    if response.status == 200:
-                        logger.info("Response forwarded to GOAT successfully")
-                    else:
-                        logger.warning(f"GOAT webhook failed: {response.status}")
-        except Exception as e:
+            response = await self.session.post(
+                webhook_url,
+                content=orjson.dumps(goat_response),
+                headers=JSON_HEADERS
+            )
+        except TRANSPORT_ERRORS as e:
             logger.error(f"Error forwarding to GOAT: {e}")
+            return
+
+        if response.status_code == 200:
+            logger.info("Response forwarded to GOAT successfully")
+        else:
+            logger.warning(f"GOAT webhook failed: {response.status_code}")
 
     async def get_goat_status(self) -> Dict[str, Any]:
         """Get GOAT-specific status information"""
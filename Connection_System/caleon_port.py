@@ -12,13 +12,18 @@ This sits OUTSIDE the cognitive core and provides:
 
 from fastapi import FastAPI, HTTPException, Depends, Query, Body, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import asyncio
 import time
 import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import Caleon cognitive core
@@ -134,19 +139,30 @@ class VoiceRequest(BaseModel):
 class VoiceResponse(BaseModel):
     """Response model for voice synthesis"""
     text: str
-    audio_path: Optional[str]
+    audio_path: Optional[str]  # first sentence's clip when phonated
+    audio_segments: Optional[List[str]] = None  # every sentence's clip, in order
     audio_duration: Optional[float]
     voice_profile: Dict[str, Any]
     pipeline_metadata: Dict[str, Any]
     stardate: str
 
+# Connection registry record
+@dataclass(slots=True)
+class Connection:
+    """A connected platform session"""
+    client: str
+    version: str
+    connected_at: float
+    capabilities: Tuple[str, ...]
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Caleon Port - Universal API Gateway",
     description="Standardized connection point for Dual Core Caleon cognitive architecture",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -169,20 +185,71 @@ task_orchestrator = None
 intent_consent = None
 vault_system = None
 voice_pipeline = None
-active_connections = {}
+left_executor = None
+right_executor = None
+active_connections: Dict[str, Connection] = {}  # Registry - /connect and /disconnect only
+_active_count = 0  # Hot-path connection count for status/live/info reads
+
+# Platform label - nebula detects it once at import, so resolve it once at startup
+PLATFORM_CTX = "unknown"
+PLATFORM_THINK_CTX = "standalone"
+
+# Hemisphere availability - set at startup, shared read-only by every response
+hemisphere_status = {"left": "inactive", "right": "inactive"}
 server_start_time = time.time()
 
+# Ollama health, refreshed by a background poller instead of probed per request
+ollama_healthy = False
+OLLAMA_HEALTH_INTERVAL = 5.0  # seconds
+background_tasks: List[asyncio.Task] = []
+
+# /ws/live subscriber queues, fed by a single status broadcaster
+live_subscribers: Set[asyncio.Queue] = set()
+LIVE_UPDATE_INTERVAL = 5.0  # seconds
+LIVE_REFRESH_TICKS = 6  # Resend an unchanged status at least every 6 ticks (30s)
+
+# Handshake constants
+SUPPORTED_CAPABILITIES = ("text", "voice", "memory", "audio", "reasoning")
+_DOT_TO_UNDERSCORE = str.maketrans(".", "_")
+
+# Constant nebula tx labels/meta - start() only reads meta, so these are shared
+_META_VOICE = "voice_synthesis"
+_META_SPEAK_TEXT = "speak_text"
+_VOICE_META = {"endpoint": "voice"}
+_SPEAK_TEXT_META = {"mode": "text_only"}
+# ThinkRequest.priority is pattern-validated, so every value has a prebuilt meta
+_PRIORITY_META = {p: {"priority": p} for p in (None, "low", "normal", "high", "urgent")}
+_ERR_PREFIX = "ERROR: "
+
+# Mixed into the message hash to derive an independent right-hemisphere stimulus
+RIGHT_STIMULUS_SALT = 0xBADC0FFEE
+
+# /pulse body, re-encoded only when the second rolls over or drift flips
+_pulse_cache = {"key": None, "body": b""}
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the Caleon cognitive system"""
     global left_hemisphere, right_hemisphere, final_harmonizer, task_orchestrator, intent_consent, vault_system
+    global left_executor, right_executor, PLATFORM_CTX, PLATFORM_THINK_CTX
 
     try:
         logger.info("Initializing Dual Core Caleon...")
 
+        if nebula:
+            PLATFORM_CTX = PLATFORM_THINK_CTX = nebula.platform
+
         # Initialize hemispheres
         left_hemisphere = LeftSynaptic("left")
         right_hemisphere = RightSynaptic("right")
+        left_hemisphere.warmup()
+        right_hemisphere.warmup()
+        hemisphere_status.update(left="active", right="active")
+
+        # One worker per hemisphere: left and right resonate in parallel off the
+        # event loop, while each resonator still sees its calls one at a time
+        left_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="left_hemisphere")
+        right_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="right_hemisphere")
 
         # Initialize final harmonizer
         final_harmonizer = FinalHarmonizer()
@@ -201,47 +268,75 @@ async def startup_event():
         global voice_pipeline
         voice_pipeline = CaleonVoicePipeline(vault_system, text_only_mode=True)
 
-        logger.info(f"Caleon Port startup complete - connected to {nebula.platform} system")
+        # Start background probes
+        background_tasks.append(asyncio.create_task(_ollama_health_poller()))
+        background_tasks.append(asyncio.create_task(_status_broadcaster()))
+
+        logger.info("Caleon Port startup complete - connected to %s system", PLATFORM_CTX)
 
     except Exception as e:
-        logger.error(f"Failed to initialize Caleon: {e}")
+        logger.error("Failed to initialize Caleon: %s", e)
         raise
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
-    global active_connections
+    global active_connections, _active_count
+    for task in background_tasks:
+        task.cancel()
+    background_tasks.clear()
+    for executor in (left_executor, right_executor):
+        if executor:
+            executor.shutdown(wait=False)
+    await ollama_enhancer.client.close()
     active_connections.clear()
+    _active_count = 0
     logger.info("Caleon Port shutdown complete")
 
+async def _ollama_health_poller():
+    """Keep the cached Ollama health flag fresh"""
+    global ollama_healthy
+    while True:
+        ollama_healthy = await ollama_enhancer.client.check_health()
+        await asyncio.sleep(OLLAMA_HEALTH_INTERVAL)
+
 # Authentication dependency
+@lru_cache(maxsize=4096)
+def _build_auth_record(token: str) -> Dict[str, str]:
+    """One auth record per token - shared across requests, treat as read-only"""
+    return {"client": "authenticated", "token": token}
+
 async def verify_auth(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Simple authentication - extend as needed"""
     if credentials is None:
         raise HTTPException(status_code=401, detail="Authentication required")
 
     # For now, accept any token - implement proper auth logic
-    return {"client": "authenticated", "token": credentials.credentials}
+    return _build_auth_record(credentials.credentials)
 
 # Routes
 @app.get("/api/v1/pulse", response_model=PulseResponse)
 async def get_pulse():
     """Get current ISS pulse and timing information"""
     try:
-        cycle_id = ISS.pulse()
-        stardate = ISS.stardate()
-        unix = ISS.unix()
+        # Drift is measured between calls, so it is still checked on every hit
         drift = ISS.detect_drift()
+        key = (int(time.time()), drift)
 
-        return PulseResponse(
-            cycle_id=cycle_id,
-            stardate=stardate,
-            unix=unix,
-            drift_detected=drift,
-            system_uptime=time.time() - server_start_time
-        )
+        if key != _pulse_cache["key"]:
+            # Trusted: every field comes from ISS - encode directly, no model pass
+            _pulse_cache["body"] = orjson.dumps({
+                "cycle_id": ISS.pulse(),
+                "stardate": ISS.stardate(),
+                "unix": ISS.unix(),
+                "drift_detected": drift,
+                "system_uptime": time.time() - server_start_time
+            })
+            _pulse_cache["key"] = key
+
+        return Response(content=_pulse_cache["body"], media_type="application/json")
     except Exception as e:
-        logger.error(f"Pulse endpoint error: {e}")
+        logger.error("Pulse endpoint error: %s", e)
         raise HTTPException(status_code=500, detail="Pulse generation failed")
 
 @app.post("/api/v1/think", response_model=ThinkResponse)
@@ -253,7 +348,7 @@ async def think(
     start_time = time.time()
 
     # Start nebula transaction
-    tx = start(session=str(auth), prompt=request.message, meta={"priority": request.priority})
+    tx = start(session=str(auth), prompt=request.message, meta=_PRIORITY_META[request.priority])
 
     try:
         # Get timing baseline
@@ -265,7 +360,8 @@ async def think(
         auth_result = intent_consent.authorize(request.message, {"priority": request.priority})
         if not auth_result:
             end(tx, "DENIED")
-            return ThinkResponse(
+            # Trusted: built from ISS timing and a fixed denial payload
+            return ThinkResponse.model_construct(
                 cycle_id=cycle_id,
                 stardate=stardate,
                 unix=unix,
@@ -275,70 +371,78 @@ async def think(
                 processing_time=time.time() - start_time
             )
 
-        # Process through left hemisphere
-        left_stimulus = float(hash(request.message) % 1000) / 1000.0  # Convert to 0-1 range
-        left_result = left_hemisphere.resonate(left_stimulus)
+        # One hash pass over the message; the right hemisphere gets a remix of it
+        message_hash = hash(request.message)
 
-        # Process through right hemisphere
-        right_stimulus = float(hash(request.message[::-1]) % 1000) / 1000.0
-        right_result = right_hemisphere.resonate(right_stimulus)
+        left_stimulus = float(message_hash % 1000) / 1000.0  # Convert to 0-1 range
+        right_stimulus = float(hash((message_hash, RIGHT_STIMULUS_SALT)) % 1000) / 1000.0
+
+        # Process both hemispheres concurrently
+        loop = asyncio.get_running_loop()
+        left_result, right_result = await asyncio.gather(
+            loop.run_in_executor(left_executor, left_hemisphere.resonate, left_stimulus),
+            loop.run_in_executor(right_executor, right_hemisphere.resonate, right_stimulus)
+        )
 
         # Final harmonization
-        harmonized = final_harmonizer.harmonize(
+        harmonized = await final_harmonizer.harmonize(
             left_result['synaptic_verdict'],
             right_result['synaptic_verdict'],
             request.message
         )
 
-        # Queue the result as a task for execution
-        task_item = {
-            "verdict": harmonized['verdict'],
-            "reasoning_chain": {
-                "left_hemisphere": left_result,
-                "right_hemisphere": right_result,
-                "harmonization": harmonized
-            },
-            "cycle_id": cycle_id
-        }
-        task_orchestrator.queue(task_item)
-
-        processing_time = time.time() - start_time
-
-        # Generate audio response (placeholder - integrate with phonatory)
-        audio_file = None
-        # TODO: Integrate with phonatory module for speech synthesis
-
-        # Enhance with Ollama insights
+        # Enhance with Ollama insights - started now so the LLM round-trip
+        # overlaps task queuing instead of following it
         context = {
-            "platform": nebula.platform if nebula else "standalone",
+            "platform": PLATFORM_THINK_CTX,
             "priority": request.priority,
             "stardate": stardate,
-            "hemisphere_data": {
-                "left": "active" if left_hemisphere else "inactive",
-                "right": "active" if right_hemisphere else "inactive"
-            }
+            "hemisphere_data": hemisphere_status
         }
 
-        ollama_result = ollama_enhancer.enhance_thinking(
+        # Built once - shared by the enhancer, the queued task and the response
+        reasoning_chain = {
+            "left_hemisphere": left_result,
+            "right_hemisphere": right_result,
+            "harmonization": harmonized
+        }
+
+        ollama_future = asyncio.create_task(ollama_enhancer.enhance_thinking(
             request.message,
-            {
-                "left_hemisphere": left_result,
-                "right_hemisphere": right_result
-            },
+            reasoning_chain,
             harmonized,
             context
-        )
+        ))
+
+        try:
+            # Queue the result as a task for execution
+            task_item = {
+                "verdict": harmonized['verdict'],
+                "reasoning_chain": reasoning_chain,
+                "cycle_id": cycle_id
+            }
+            task_orchestrator.enqueue(task_item)
+
+            processing_time = time.time() - start_time
+
+            # Generate audio response (placeholder - integrate with phonatory)
+            audio_file = None
+            # TODO: Integrate with phonatory module for speech synthesis
+
+            ollama_result = await ollama_future
+        finally:
+            # Don't leave the Ollama request running if queuing failed or we were cancelled
+            if not ollama_future.done():
+                ollama_future.cancel()
 
-        result = ThinkResponse(
+        # Trusted: hemisphere, harmonizer and Ollama results are our own output;
+        # only the incoming ThinkRequest crosses the validation boundary
+        result = ThinkResponse.model_construct(
             cycle_id=cycle_id,
             stardate=stardate,
             unix=unix,
             final_verdict=harmonized['verdict'],
-            reasoning_chain={
-                "left_hemisphere": left_result,
-                "right_hemisphere": right_result,
-                "harmonization": harmonized
-            },
+            reasoning_chain=reasoning_chain,
             confidence=harmonized.get('confidence', 0.8),
             processing_time=processing_time,
             audio_file=audio_file,
@@ -351,8 +455,8 @@ async def think(
         return result
 
     except Exception as e:
-        logger.error(f"Think endpoint error: {e}")
-        end(tx, f"ERROR: {str(e)}")
+        logger.error("Think endpoint error: %s", e)
+        end(tx, _ERR_PREFIX + str(e))
         raise HTTPException(status_code=500, detail="Cognitive processing failed")
 
 @app.post("/api/v1/speak/text", response_model=VoiceResponse)
@@ -363,7 +467,7 @@ async def speak_text_only(request: VoiceRequest, auth=Depends(verify_auth)):
             raise HTTPException(status_code=500, detail="Voice pipeline not initialized")
 
         # Start nebula transaction
-        tx = start(session=str(auth), action="speak_text", meta={"mode": "text_only"})
+        tx = start(session=str(auth), action=_META_SPEAK_TEXT, meta=_SPEAK_TEXT_META)
 
         # Process through voice pipeline (text-only mode)
         result = await voice_pipeline.speak(
@@ -377,6 +481,7 @@ async def speak_text_only(request: VoiceRequest, auth=Depends(verify_auth)):
         return VoiceResponse(
             text=result["text"],
             audio_path=result["audio_path"],
+            audio_segments=result.get("audio_segments"),
             audio_duration=result["audio_duration"],
             voice_profile=result["voice_profile"],
             pipeline_metadata=result["pipeline_metadata"],
@@ -384,8 +489,8 @@ async def speak_text_only(request: VoiceRequest, auth=Depends(verify_auth)):
         )
 
     except Exception as e:
-        logger.error(f"Text speech endpoint error: {e}")
-        end(tx, f"ERROR: {str(e)}")
+        logger.error("Text speech endpoint error: %s", e)
+        end(tx, _ERR_PREFIX + str(e))
         raise HTTPException(status_code=500, detail="Text articulation failed")
 
         result = await ollama_engine.query(prompt, system, context)
@@ -399,7 +504,7 @@ async def speak_text_only(request: VoiceRequest, auth=Depends(verify_auth)):
         return result
 
     except Exception as e:
-        logger.error(f"Phi-3 endpoint error: {e}")
+        logger.error("Phi-3 endpoint error: %s", e)
         raise HTTPException(status_code=500, detail="Phi-3 reasoning failed")
 
 @app.post("/api/v1/voice", response_model=VoiceResponse)
@@ -410,7 +515,7 @@ async def caleon_voice(request: VoiceRequest, auth=Depends(verify_auth)):
             raise HTTPException(status_code=503, detail="Voice pipeline not initialized")
 
         # Start nebula transaction
-        tx = start(session=str(auth), prompt="voice_synthesis", meta={"endpoint": "voice"})
+        tx = start(session=str(auth), prompt=_META_VOICE, meta=_VOICE_META)
 
         # Run complete voice pipeline
         result = await voice_pipeline.speak(
@@ -429,7 +534,7 @@ async def caleon_voice(request: VoiceRequest, auth=Depends(verify_auth)):
         return result
 
     except Exception as e:
-        logger.error(f"Voice endpoint error: {e}")
+        logger.error("Voice endpoint error: %s", e)
         raise HTTPException(status_code=500, detail="Voice synthesis failed")
 
 @app.post("/api/v1/task/queue", response_model=TaskResponse)
@@ -439,19 +544,21 @@ async def queue_task(
 ):
     """Queue a task for execution"""
     try:
+        submitted_at = ISS.unix()
+        stardate = ISS.stardate()
         task_item = {
             "data": request.task_data,
             "priority": request.priority,
-            "submitted_at": ISS.unix()
+            "submitted_at": submitted_at
         }
-        pulse = task_orchestrator.queue(task_item)
+        pulse = task_orchestrator.enqueue(task_item)
         return TaskResponse(
             task_id=pulse,
             status="queued",
-            timestamp=ISS.stardate()
+            timestamp=stardate
         )
     except Exception as e:
-        logger.error(f"Task queue error: {e}")
+        logger.error("Task queue error: %s", e)
         raise HTTPException(status_code=500, detail="Task queuing failed")
 
 @app.get("/api/v1/task/next", response_model=TaskResponse)
@@ -471,7 +578,7 @@ async def get_next_task(auth=Depends(verify_auth)):
             timestamp=ISS.stardate()
         )
     except Exception as e:
-        logger.error(f"Task next error: {e}")
+        logger.error("Task next error: %s", e)
         raise HTTPException(status_code=500, detail="Task retrieval failed")
 
 @app.post("/api/v1/task/done", response_model=TaskResponse)
@@ -488,7 +595,7 @@ async def mark_task_done(
             timestamp=ISS.stardate()
         )
     except Exception as e:
-        logger.error(f"Task done error: {e}")
+        logger.error("Task done error: %s", e)
         raise HTTPException(status_code=500, detail="Task completion failed")
 
 @app.post("/api/v1/vault/query", response_model=VaultQueryResponse)
@@ -508,41 +615,40 @@ async def query_vault(
             total_results=len(results)
         )
     except Exception as e:
-        logger.error(f"Vault query error: {e}")
+        logger.error("Vault query error: %s", e)
         raise HTTPException(status_code=500, detail="Vault query failed")
 
 @app.get("/api/v1/status", response_model=StatusResponse)
 async def get_status(auth=Depends(verify_auth)):
     """Get comprehensive system status"""
     try:
-        # Get hemisphere status
-        hemisphere_status = {
-            "left": "active" if left_hemisphere else "inactive",
-            "right": "active" if right_hemisphere else "inactive"
-        }
-
         # Get component status
         task_orchestrator_status = "active" if task_orchestrator else "inactive"
         intent_consent_status = "active" if intent_consent else "inactive"
         vault_system_status = "active" if vault_system else "inactive"
         nebula_status = "active" if nebula else "inactive"
-        platform_context = nebula.platform if nebula else "unknown"
-        ollama_status = "active" if ollama_enhancer.client.check_health() else "inactive"
+        platform_context = PLATFORM_CTX
+        ollama_status = "active" if ollama_healthy else "inactive"
+
+        # Snapshot per-request values once
+        connections = _active_count
+        last_pulse = ISS.stardate()
 
         # Calculate cognitive load (simplified)
-        cognitive_load = len(active_connections) / 10.0  # Scale 0-1
+        cognitive_load = connections / 10.0  # Scale 0-1
 
         # Memory usage (simplified)
         memory_usage = {
-            "active_connections": len(active_connections),
+            "active_connections": connections,
             "hemispheres_loaded": sum(1 for h in hemisphere_status.values() if h == "active"),
             "uptime_seconds": time.time() - server_start_time
         }
 
-        return StatusResponse(
+        # Trusted: assembled from in-process counters and component flags
+        return StatusResponse.model_construct(
             status="operational",
             version="1.0.0",
-            active_connections=len(active_connections),
+            active_connections=connections,
             cognitive_load=min(cognitive_load, 1.0),
             memory_usage=memory_usage,
             hemisphere_status=hemisphere_status,
@@ -552,86 +658,131 @@ async def get_status(auth=Depends(verify_auth)):
             nebula_status=nebula_status,
             platform_context=platform_context,
             ollama_status=ollama_status,
-            last_pulse=ISS.stardate()
+            last_pulse=last_pulse
         )
 
     except Exception as e:
-        logger.error(f"Status endpoint error: {e}")
+        logger.error("Status endpoint error: %s", e)
         raise HTTPException(status_code=500, detail="Status retrieval failed")
 
+def _live_status_state() -> Tuple:
+    """Snapshot the /ws/live fields that change with system state"""
+    connections = _active_count
+    return (
+        PLATFORM_CTX,
+        connections,
+        min(connections / 10.0, 1.0),
+        hemisphere_status["left"],
+        hemisphere_status["right"],
+        "active" if ollama_healthy else "inactive"
+    )
+
+def _live_status_payload() -> str:
+    """Build and encode one /ws/live status snapshot"""
+    unix = ISS.unix()
+    stardate = ISS.stardate()
+    connections = _active_count
+    status_data = {
+        "type": "status_update",
+        "timestamp": unix,
+        "stardate": stardate,
+        "platform": PLATFORM_CTX,
+        "active_connections": connections,
+        "cognitive_load": min(connections / 10.0, 1.0),
+        "hemisphere_status": hemisphere_status,
+        "ollama_status": "active" if ollama_healthy else "inactive"
+    }
+    # orjson encodes; still a text frame since the UI JSON.parse()s event.data
+    return orjson.dumps(status_data).decode()
+
+async def _status_broadcaster():
+    """Build the live status once per tick and fan it out to every subscriber"""
+    last_state = None
+    idle_ticks = 0
+    while True:
+        await asyncio.sleep(LIVE_UPDATE_INTERVAL)
+        if not live_subscribers:
+            continue
+
+        # Stardate moves every tick, so coalesce on the state fields instead
+        state = _live_status_state()
+        idle_ticks += 1
+        if state == last_state and idle_ticks < LIVE_REFRESH_TICKS:
+            continue
+        last_state = state
+        idle_ticks = 0
+
+        payload = _live_status_payload()
+        for queue in live_subscribers:
+            if queue.full():
+                queue.get_nowait()  # Slow socket - drop its stale update
+            queue.put_nowait(payload)
+
 @app.websocket("/ws/live")
 async def websocket_live_updates(websocket: WebSocket):
     """WebSocket endpoint for real-time system updates"""
     await websocket.accept()
     logger.info("WebSocket connection established")
 
+    # First update goes out immediately, later ones come from the broadcaster
+    queue = asyncio.Queue(maxsize=1)
+    queue.put_nowait(_live_status_payload())
+    live_subscribers.add(queue)
+
     try:
         while True:
-            # Send periodic status updates
-            status_data = {
-                "type": "status_update",
-                "timestamp": ISS.unix(),
-                "stardate": ISS.stardate(),
-                "platform": nebula.platform if nebula else "unknown",
-                "active_connections": len(active_connections),
-                "cognitive_load": min(len(active_connections) / 10.0, 1.0),
-                "hemisphere_status": {
-                    "left": "active" if left_hemisphere else "inactive",
-                    "right": "active" if right_hemisphere else "inactive"
-                },
-                "ollama_status": "active" if ollama_enhancer.client.check_health() else "inactive"
-            }
-            await websocket.send_json(status_data)
-
-            # Wait before next update
-            await asyncio.sleep(5)  # Update every 5 seconds
+            # Shielded so a cancel mid-send can't leave a half-written frame
+            await asyncio.shield(websocket.send_text(await queue.get()))
 
     except WebSocketDisconnect:
         logger.info("WebSocket connection closed")
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
+    finally:
+        live_subscribers.discard(queue)
 
 @app.post("/api/v1/connect", response_model=ConnectResponse)
 async def connect(request: ConnectRequest):
     """Platform connection handshake"""
+    global _active_count
     try:
-        # Generate session ID
-        session_id = f"session_{ISS.pulse().replace('PULSE-', '').replace('.', '_')}"
+        # Generate session ID - PULSE-<unix>.<cycle> -> session_<unix>_<cycle>
+        session_id = "session_" + ISS.pulse()[6:].translate(_DOT_TO_UNDERSCORE)
 
         # Store connection
-        active_connections[session_id] = {
-            "client": request.client,
-            "version": request.version,
-            "connected_at": ISS.unix(),
-            "capabilities": request.capabilities
-        }
-
-        # Supported capabilities
-        supported = ["text", "voice", "memory", "audio", "reasoning"]
+        active_connections[session_id] = Connection(
+            client=request.client,
+            version=request.version,
+            connected_at=ISS.unix(),
+            capabilities=tuple(request.capabilities)
+        )
+        _active_count += 1  # Pulse-derived session IDs never collide
 
         # Simple auth check (extend as needed)
         auth_valid = len(request.auth_token) > 10  # Basic check
 
-        logger.info(f"New connection: {request.client} v{request.version} - Session: {session_id}")
+        logger.info("New connection: %s v%s - Session: %s", request.client, request.version, session_id)
 
         return ConnectResponse(
             connected=True,
             session_id=session_id,
             server_version="1.0.0",
-            supported_capabilities=supported,
+            supported_capabilities=SUPPORTED_CAPABILITIES,
             auth_valid=auth_valid
         )
 
     except Exception as e:
-        logger.error(f"Connect endpoint error: {e}")
+        logger.error("Connect endpoint error: %s", e)
         raise HTTPException(status_code=500, detail="Connection failed")
 
 @app.delete("/api/v1/connect/{session_id}")
 async def disconnect(session_id: str, auth=Depends(verify_auth)):
     """Disconnect a client session"""
+    global _active_count
     if session_id in active_connections:
         del active_connections[session_id]
-        logger.info(f"Disconnected session: {session_id}")
+        _active_count -= 1
+        logger.info("Disconnected session: %s", session_id)
         return {"message": "Disconnected successfully"}
     else:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -658,17 +809,26 @@ async def system_info():
         "version": "1.0.0",
         "architecture": "Dual Hemisphere Cognitive Kernel",
         "timing": "ISS Brainstem Synchronized",
-        "connections": len(active_connections),
+        "connections": _active_count,
         "capabilities": ["reasoning", "memory", "speech", "temporal_coherence", "voice_synthesis"],
         "voice_pipeline": voice_health
     }
 
 if __name__ == "__main__":
     import uvicorn
+
+    # libuv event loop where available (Linux/macOS); stock asyncio on Windows dev
+    try:
+        import uvloop  # noqa: F401
+        event_loop = "uvloop"
+    except ImportError:
+        event_loop = "asyncio"
+
     uvicorn.run(
         "connection_system.caleon_port:app",
         host="0.0.0.0",
         port=8000,
         reload=True,
+        loop=event_loop,
         log_level="info"
     )
\ No newline at end of file
@@ -6,10 +6,11 @@ This is the "spinal cord" that connects the brain (Caleon core) to the nerves (a
 """
 
 import asyncio
+import httpx
 import logging
+import orjson
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
-import json
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator, Callable, NamedTuple
 import time
 from pathlib import Path
 
@@ -17,6 +18,55 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("connection_spine")
 
+# Request headers for pre-serialized (orjson) JSON bodies
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Failures an adapter's HTTP round-trip can raise - everything else is a bug
+TRANSPORT_ERRORS = (httpx.HTTPError, orjson.JSONDecodeError)
+
+# Shared HTTP/2 client - concurrent adapter calls multiplex over one connection
+_session: Optional[httpx.AsyncClient] = None
+_session_refs = 0
+
+async def get_session() -> httpx.AsyncClient:
+    """Get the shared adapter HTTP client, creating it on first use"""
+    global _session, _session_refs
+    if _session is None or _session.is_closed:
+        _session = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60
+            ),
+            timeout=httpx.Timeout(45.0, connect=5.0)
+        )
+    _session_refs += 1
+    return _session
+
+async def release_session():
+    """Release a reference to the shared client, closing it on last release"""
+    global _session, _session_refs
+    _session_refs = max(0, _session_refs - 1)
+    if _session_refs == 0 and _session is not None:
+        await _session.aclose()
+        _session = None
+
+class QueuedMessage(NamedTuple):
+    """One message waiting in the spine's processing queue"""
+    platform: str
+    message: str
+    callback: Optional[Callable]
+
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge override into base in place - nested dicts are merged, not replaced"""
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _deep_merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
 class CaleonAdapter(ABC):
     """Abstract base class for all Caleon platform adapters"""
 
@@ -28,6 +78,10 @@ class CaleonAdapter(ABC):
         self.caleon_port_url = self.config.get("caleon_port_url", "http://localhost:8000")
         self.auth_token = self.config.get("auth_token", "")
 
+        # One connect at a time; cap concurrent sends for back-pressure
+        self._connect_lock = asyncio.Lock()
+        self._inflight = asyncio.Semaphore(self.config.get("max_inflight", 32))
+
     @abstractmethod
     async def connect(self) -> bool:
         """Establish connection to Caleon Port"""
@@ -48,6 +102,20 @@ class CaleonAdapter(ABC):
         """Process response from Caleon"""
         pass
 
+    async def send_batch(self, messages: List[str]) -> List[Any]:
+        """Send several messages to Caleon - one result (or exception) per message.
+
+        Adapters with a bulk endpoint can override this; the default sends
+        them one after another so per-platform ordering is kept.
+        """
+        results = []
+        for message in messages:
+            try:
+                results.append(await self.send_message(message))
+            except Exception as e:
+                results.append(e)
+        return results
+
     async def get_status(self) -> Dict[str, Any]:
         """Get adapter status"""
         return {
@@ -68,6 +136,12 @@ class ConnectionSpine:
         self.config = self._load_config(config_file)
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
         self.message_queue = asyncio.Queue(maxsize=1000)
+        self.batch_window_ms = 20  # How long a batch waits to fill after its first message
+        self.max_batch_size = 64
+        self._callback_slots = asyncio.Semaphore(32)  # Concurrent message callbacks
+        self._pending_messages = 0  # Queued or in-flight, kept alongside put/task_done
+        self.status_cache_ttl = 1.0  # seconds
+        self._status_cache = (0.0, None)  # (monotonic built-at, status)
 
         # Start background message processor
         self.processor_task = None
@@ -90,9 +164,8 @@ class ConnectionSpine:
         }
 
         if config_file and Path(config_file).exists():
-            with open(config_file, 'r') as f:
-                user_config = json.load(f)
-                default_config.update(user_config)
+            user_config = orjson.loads(Path(config_file).read_bytes())
+            _deep_merge(default_config, user_config)
 
         return default_config
 
@@ -107,16 +180,19 @@ class ConnectionSpine:
             logger.error(f"Failed to register adapter {adapter.platform_name}: {e}")
             return False
 
-    def unregister_adapter(self, platform_name: str) -> bool:
-        """Unregister an adapter"""
+    async def unregister_adapter(self, platform_name: str) -> bool:
+        """Unregister an adapter, returning once its disconnect has finished"""
         adapter_name = platform_name.lower()
-        if adapter_name in self.adapters:
-            # Disconnect first
-            asyncio.create_task(self.adapters[adapter_name].disconnect())
-            del self.adapters[adapter_name]
-            logger.info(f"Unregistered adapter: {adapter_name}")
-            return True
-        return False
+        adapter = self.adapters.pop(adapter_name, None)
+        if adapter is None:
+            return False
+
+        try:
+            await adapter.disconnect()
+        except Exception as e:
+            logger.error(f"Error disconnecting adapter {adapter_name}: {e}")
+        logger.info(f"Unregistered adapter: {adapter_name}")
+        return True
 
     async def connect_adapter(self, platform_name: str) -> bool:
         """Connect a specific adapter"""
@@ -156,44 +232,106 @@ class ConnectionSpine:
         if adapter_name not in self.adapters:
             raise ValueError(f"Adapter not found: {adapter_name}")
 
+        return await self._send_via(self.adapters[adapter_name], message, **kwargs)
+
+    async def _send_via(self, adapter: CaleonAdapter, message: str, **kwargs) -> Dict[str, Any]:
+        """Send through an already-resolved adapter"""
+        await self._ensure_connected(adapter)
+
+        async with adapter._inflight:
+            return await adapter.send_message(message, **kwargs)
+
+    async def _ensure_connected(self, adapter: CaleonAdapter):
+        """Auto-connect an adapter - concurrent senders share a single connect"""
+        if adapter.connected:
+            return
+        async with adapter._connect_lock:
+            if not adapter.connected:
+                await adapter.connect()
+
+    async def _send_batch_to_caleon(self, platform_name: str, messages: List[str]) -> List[Any]:
+        """Send a batch of messages through one adapter"""
+        adapter_name = platform_name.lower()
+        if adapter_name not in self.adapters:
+            raise ValueError(f"Adapter not found: {adapter_name}")
+
         adapter = self.adapters[adapter_name]
-        if not adapter.connected:
-            # Auto-connect if not connected
-            await adapter.connect()
+        await self._ensure_connected(adapter)
 
-        return await adapter.send_message(message, **kwargs)
+        async with adapter._inflight:
+            return await adapter.send_batch(messages)
 
     async def broadcast_message(self, message: str, platforms: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
         """Send message to multiple platforms"""
         if platforms is None:
             platforms = list(self.adapters.keys())
 
+        # Resolve every adapter once, up front
+        adapters = [self.adapters.get(platform.lower()) for platform in platforms]
+        missing = [platform for platform, adapter in zip(platforms, adapters) if adapter is None]
+        if missing:
+            raise ValueError(f"Adapters not found: {', '.join(missing)}")
+
+        # Adapters are independent - overlap their round-trips
+        send = self._send_via
+        raw = await asyncio.gather(
+            *(send(adapter, message) for adapter in adapters),
+            return_exceptions=True
+        )
+
         results = {}
-        for platform in platforms:
-            try:
-                result = await self.send_to_caleon(platform, message)
+        for platform, result in zip(platforms, raw):
+            if isinstance(result, BaseException):
+                results[platform] = {"error": str(result)}
+            else:
                 results[platform] = result
-            except Exception as e:
-                results[platform] = {"error": str(e)}
 
         return results
 
+    async def broadcast_stream(self, message: str,
+                               platforms: Optional[List[str]] = None) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Send message to multiple platforms, yielding (platform, result) as each responds"""
+        if platforms is None:
+            platforms = list(self.adapters.keys())
+
+        async def _send(platform: str) -> Tuple[str, Dict[str, Any]]:
+            try:
+                return platform, await self.send_to_caleon(platform, message)
+            except Exception as e:
+                return platform, {"error": str(e)}
+
+        tasks = [asyncio.create_task(_send(platform)) for platform in platforms]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Caller stopped early - don't leave the slower sends running
+            for task in tasks:
+                task.cancel()
+
     async def get_system_status(self) -> Dict[str, Any]:
-        """Get comprehensive system status"""
+        """Get comprehensive system status (cached for status_cache_ttl seconds)"""
+        built_at, status = self._status_cache
+        now = time.monotonic()
+        if status is not None and now - built_at < self.status_cache_ttl:
+            return status
+
         adapter_statuses = {}
         for name, adapter in self.adapters.items():
             adapter_statuses[name] = await adapter.get_status()
 
-        return {
+        status = {
             "connection_spine": {
                 "status": "active",
                 "adapters_registered": len(self.adapters),
                 "active_sessions": len(self.active_sessions),
-                "queue_size": self.message_queue.qsize()
+                "queue_size": self._pending_messages
             },
             "adapters": adapter_statuses,
             "config": self.config
         }
+        self._status_cache = (now, status)
+        return status
 
     async def start_message_processor(self):
         """Start background message processing"""
@@ -208,38 +346,94 @@ class ConnectionSpine:
             except asyncio.CancelledError:
                 pass
 
-    async def _process_messages(self):
-        """Background message processor"""
-        while True:
-            try:
-                # Get message from queue
-                message_data = await self.message_queue.get()
-
-                platform = message_data.get("platform")
-                message = message_data.get("message")
-                callback = message_data.get("callback")
-
-                # Process message
-                result = await self.send_to_caleon(platform, message)
+    async def shutdown(self):
+        """Stop message processing and tear down every registered adapter"""
+        await self.stop_message_processor()
+        await asyncio.gather(*(self.unregister_adapter(name) for name in list(self.adapters)))
 
-                # Call callback if provided
+    async def _process_messages(self):
+        """Background message processor - drains the queue in batches.
+
+        Callbacks run as tasks in a TaskGroup so the next batch is dequeued
+        while they finish; cancelling the processor cancels them too.
+        """
+        loop = asyncio.get_running_loop()
+        window = self.batch_window_ms / 1000
+
+        async with asyncio.TaskGroup() as callbacks:
+            while True:
+                # First message seeds the batch
+                batch = [await self.message_queue.get()]
+
+                try:
+                    # Collect more messages until the window closes or the batch fills
+                    deadline = loop.time() + window
+                    while len(batch) < self.max_batch_size:
+                        try:
+                            batch.append(self.message_queue.get_nowait())
+                            continue
+                        except asyncio.QueueEmpty:
+                            pass
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            batch.append(await asyncio.wait_for(self.message_queue.get(), remaining))
+                        except asyncio.TimeoutError:
+                            break
+
+                    await self._dispatch_batch(batch, callbacks)
+
+                except Exception as e:
+                    logger.error(f"Message processing error: {e}")
+                finally:
+                    # Settled once sent - callbacks may still be running
+                    for _ in batch:
+                        self.message_queue.task_done()
+                    self._pending_messages -= len(batch)
+
+    async def _dispatch_batch(self, batch: List[QueuedMessage], callbacks: asyncio.TaskGroup):
+        """Send a drained batch - platforms concurrently, messages in order per platform"""
+        by_platform: Dict[str, List[QueuedMessage]] = {}
+        for queued in batch:
+            by_platform.setdefault(queued.platform, []).append(queued)
+
+        platforms = list(by_platform)
+        raw = await asyncio.gather(
+            *(self._send_batch_to_caleon(platform, [queued.message for queued in by_platform[platform]])
+              for platform in platforms),
+            return_exceptions=True
+        )
+
+        for platform, results in zip(platforms, raw):
+            items = by_platform[platform]
+            if isinstance(results, BaseException):
+                results = [results] * len(items)
+
+            for queued, result in zip(items, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Message processing error: {result}")
+                    continue
+
+                # Call callback if provided - capped, and off the dequeue path
+                callback = queued.callback
                 if callback:
-                    await callback(result)
+                    await self._callback_slots.acquire()
+                    callbacks.create_task(self._run_callback(callback, result))
 
-                self.message_queue.task_done()
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Message processing error: {e}")
+    async def _run_callback(self, callback, result: Dict[str, Any]):
+        """Run one message callback, keeping its failure out of the TaskGroup"""
+        try:
+            await callback(result)
+        except Exception as e:
+            logger.error(f"Message callback error: {e}")
+        finally:
+            self._callback_slots.release()
 
     async def queue_message(self, platform: str, message: str, callback: Optional[callable] = None):
         """Queue message for background processing"""
-        await self.message_queue.put({
-            "platform": platform,
-            "message": message,
-            "callback": callback
-        })
+        await self.message_queue.put(QueuedMessage(platform, message, callback))
+        self._pending_messages += 1
 
     def get_available_adapters(self) -> List[str]:
         """Get list of available adapter platforms"""
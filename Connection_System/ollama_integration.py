@@ -3,14 +3,63 @@ Ollama Integration for Caleon
 Provides enhanced reasoning capabilities using local Ollama models
 """
 
-import requests
+import httpx
 import json
+import hashlib
 import logging
-from typing import Dict, Any, Optional
+import orjson
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Optional, AsyncIterator
 import time
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None  # Fall back to hashlib.blake2b for response cache keys
+
 logger = logging.getLogger("ollama_integration")
 
+# Prompt templates - built once, only the variables are filled per call
+SYSTEM_PROMPT_TEMPLATE = """You are Caleon, an advanced AI system running on platform: {platform}.
+You have dual-hemisphere cognitive architecture with the following current state:
+- Left Hemisphere: {left}
+- Right Hemisphere: {right}
+- Priority Level: {priority}
+
+Provide insightful, analytical responses that complement the dual-core cognitive processing.
+Focus on logical reasoning, pattern recognition, and creative problem-solving.
+Keep responses concise but comprehensive."""
+
+ENHANCEMENT_PROMPT_TEMPLATE = """Analyze this cognitive processing result and provide enhanced insights:
+
+USER QUERY: {user_message}
+
+COGNITIVE PROCESSING RESULTS:
+- Left Hemisphere Verdict: {left_verdict}
+- Right Hemisphere Verdict: {right_verdict}
+- Final Harmonized Verdict: {verdict}
+- Confidence: {confidence:.2f}
+
+CONTEXT:
+- Platform: {platform}
+- Priority: {priority}
+- Stardate: {stardate}
+
+Provide 2-3 key insights that enhance or complement the dual-hemisphere cognitive processing.
+Focus on:
+1. Deeper pattern analysis
+2. Alternative perspectives
+3. Practical implications
+4. Creative solutions
+
+Keep your response concise and actionable."""
+
+@lru_cache(maxsize=64)
+def _render_system_prompt(platform: str, left: str, right: str, priority: str) -> str:
+    """System prompt for one (platform, hemispheres, priority) state - these rarely change"""
+    return SYSTEM_PROMPT_TEMPLATE.format(platform=platform, left=left, right=right, priority=priority)
+
 class OllamaClient:
     """Client for interacting with local Ollama API"""
 
@@ -18,55 +67,134 @@ class OllamaClient:
         self.base_url = base_url
         self.model = model
         self.timeout = 30  # seconds
+        self.temperature = 0.7
+        self.health_ttl = 5.0  # seconds
+        self._health_cache = (0.0, False)  # (monotonic checked-at, healthy)
+
+        # Content-addressed generate() cache - only for near-deterministic sampling
+        self.response_cache_ttl = 300.0  # seconds
+        self.response_cache_size = 256
+        self.cache_max_temperature = 0.3
+        self._resp_cache: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (monotonic stored-at, result)
+
+        # One async keep-alive client - Ollama calls no longer block the event loop
+        self.session = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=8)
+        )
+
+    def _build_payload(self, prompt: str, context: Optional[Dict[str, Any]], stream: bool) -> Dict[str, Any]:
+        """Prepare the /api/generate request payload"""
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": stream,
+            "options": {
+                "temperature": self.temperature,
+                "top_p": 0.9,
+                "num_predict": 512
+            }
+        }
+
+        # Add context if provided
+        if context:
+            payload["system"] = self._build_system_prompt(context)
+
+        return payload
+
+    @staticmethod
+    def _payload_key(payload: Dict[str, Any]) -> str:
+        """Hash of the canonical (key-sorted) payload JSON"""
+        blob = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        if xxhash is not None:
+            return xxhash.xxh3_64_hexdigest(blob)
+        return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+    def _cached_response(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached generate() result, dropping it if expired"""
+        entry = self._resp_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at >= self.response_cache_ttl:
+            del self._resp_cache[key]
+            return None
+        self._resp_cache.move_to_end(key)
+        return dict(result)
+
+    def _store_response(self, key: str, result: Dict[str, Any]):
+        """Remember a successful generate() result, evicting least recently used"""
+        self._resp_cache[key] = (time.monotonic(), result)
+        self._resp_cache.move_to_end(key)
+        while len(self._resp_cache) > self.response_cache_size:
+            self._resp_cache.popitem(last=False)
+
+    async def generate_stream(self, prompt: str,
+                              context: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Yield Ollama's NDJSON chunks as tokens arrive - the last has done=True and the timings"""
+        payload = self._build_payload(prompt, context, stream=True)
+
+        async with self.session.stream("POST", "/api/generate", json=payload) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise httpx.HTTPStatusError(
+                    f"HTTP {response.status_code}: {response.text}",
+                    request=response.request,
+                    response=response
+                )
+
+            async for line in response.aiter_lines():
+                if line:
+                    yield json.loads(line)
+
+    async def generate(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Generate response using Ollama model - collects generate_stream into one result"""
+        # Creative sampling shouldn't replay a stored answer, so cache only low temperatures
+        cache_key = None
+        if self.temperature <= self.cache_max_temperature:
+            cache_key = self._payload_key(self._build_payload(prompt, context, stream=True))
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return cached
 
-    def generate(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Generate response using Ollama model"""
         try:
-            # Prepare the request payload
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                    "num_predict": 512
-                }
+            parts = []
+            result = {}
+            async for chunk in self.generate_stream(prompt, context):
+                if "error" in chunk:
+                    return {
+                        "success": False,
+                        "error": chunk["error"],
+                        "response": ""
+                    }
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    result = chunk
+
+            generated = {
+                "success": True,
+                "response": "".join(parts),
+                "model": result.get("model", self.model),
+                "total_duration": result.get("total_duration", 0),
+                "load_duration": result.get("load_duration", 0),
+                "prompt_eval_count": result.get("prompt_eval_count", 0),
+                "eval_count": result.get("eval_count", 0),
+                "eval_duration": result.get("eval_duration", 0)
             }
+            if cache_key is not None:
+                self._store_response(cache_key, generated)
+            return generated
 
-            # Add context if provided
-            if context:
-                system_prompt = self._build_system_prompt(context)
-                payload["system"] = system_prompt
-
-            # Make the request
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=self.timeout
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "success": True,
-                    "response": result.get("response", ""),
-                    "model": result.get("model", self.model),
-                    "total_duration": result.get("total_duration", 0),
-                    "load_duration": result.get("load_duration", 0),
-                    "prompt_eval_count": result.get("prompt_eval_count", 0),
-                    "eval_count": result.get("eval_count", 0),
-                    "eval_duration": result.get("eval_duration", 0)
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"HTTP {response.status_code}: {response.text}",
-                    "response": ""
-                }
-
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPStatusError as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "response": ""
+            }
+        except httpx.HTTPError as e:
             logger.error(f"Ollama request failed: {e}")
+            self.invalidate_health()
             return {
                 "success": False,
                 "error": str(e),
@@ -82,34 +210,41 @@ class OllamaClient:
 
     def _build_system_prompt(self, context: Dict[str, Any]) -> str:
         """Build system prompt based on context"""
-        platform = context.get("platform", "unknown")
         hemisphere_data = context.get("hemisphere_data", {})
-        priority = context.get("priority", "normal")
+        return _render_system_prompt(
+            context.get("platform", "unknown"),
+            hemisphere_data.get("left", "inactive"),
+            hemisphere_data.get("right", "inactive"),
+            context.get("priority", "normal")
+        )
+
+    async def check_health(self) -> bool:
+        """Check if Ollama service is healthy (cached for health_ttl seconds)"""
+        checked_at, healthy = self._health_cache
+        now = time.monotonic()
+        if now - checked_at < self.health_ttl:
+            return healthy
 
-        system_prompt = f"""You are Caleon, an advanced AI system running on platform: {platform}.
-You have dual-hemisphere cognitive architecture with the following current state:
-- Left Hemisphere: {hemisphere_data.get('left', 'inactive')}
-- Right Hemisphere: {hemisphere_data.get('right', 'inactive')}
-- Priority Level: {priority}
-
-Provide insightful, analytical responses that complement the dual-core cognitive processing.
-Focus on logical reasoning, pattern recognition, and creative problem-solving.
-Keep responses concise but comprehensive."""
-
-        return system_prompt
-
-    def check_health(self) -> bool:
-        """Check if Ollama service is healthy"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
-            return response.status_code == 200
+            response = await self.session.get("/api/tags", timeout=5)
+            healthy = response.status_code == 200
         except:
-            return False
+            healthy = False
+        self._health_cache = (now, healthy)
+        return healthy
+
+    def invalidate_health(self):
+        """Force the next check_health to hit Ollama"""
+        self._health_cache = (0.0, False)
+
+    async def close(self):
+        """Release pooled connections"""
+        await self.session.aclose()
 
-    def list_models(self) -> list:
+    async def list_models(self) -> list:
         """List available models"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = await self.session.get("/api/tags", timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 return [model["name"] for model in data.get("models", [])]
@@ -124,11 +259,11 @@ class OllamaEnhancer:
         self.client = OllamaClient()
         self.enabled = True
 
-    def enhance_thinking(self, user_message: str, hemisphere_results: Dict[str, Any],
+    async def enhance_thinking(self, user_message: str, hemisphere_results: Dict[str, Any],
                         harmonized_result: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Enhance the cognitive result with Ollama insights"""
 
-        if not self.enabled or not self.client.check_health():
+        if not self.enabled or not await self.client.check_health():
             logger.warning("Ollama not available, skipping enhancement")
             return {
                 "ollama_enhanced": False,
@@ -143,7 +278,7 @@ class OllamaEnhancer:
             )
 
             # Get Ollama response
-            ollama_result = self.client.generate(prompt, context)
+            ollama_result = await self.client.generate(prompt, context)
 
             if ollama_result["success"]:
                 return {
@@ -178,35 +313,24 @@ class OllamaEnhancer:
                                  harmonized_result: Dict[str, Any], context: Dict[str, Any]) -> str:
         """Build a comprehensive prompt for Ollama enhancement"""
 
-        left_result = hemisphere_results.get("left_hemisphere", {})
-        right_result = hemisphere_results.get("right_hemisphere", {})
-        harmonization = harmonized_result.get("harmonization", {})
-
-        prompt = f"""Analyze this cognitive processing result and provide enhanced insights:
-
-USER QUERY: {user_message}
-
-COGNITIVE PROCESSING RESULTS:
-- Left Hemisphere Verdict: {left_result.get('synaptic_verdict', 'N/A')}
-- Right Hemisphere Verdict: {right_result.get('synaptic_verdict', 'N/A')}
-- Final Harmonized Verdict: {harmonized_result.get('verdict', 'N/A')}
-- Confidence: {harmonized_result.get('confidence', 0):.2f}
-
-CONTEXT:
-- Platform: {context.get('platform', 'unknown')}
-- Priority: {context.get('priority', 'normal')}
-- Stardate: {context.get('stardate', 'unknown')}
-
-Provide 2-3 key insights that enhance or complement the dual-hemisphere cognitive processing.
-Focus on:
-1. Deeper pattern analysis
-2. Alternative perspectives
-3. Practical implications
-4. Creative solutions
-
-Keep your response concise and actionable."""
-
-        return prompt
+        # One pass over the inputs - every field below is read exactly once
+        left_result, right_result = (
+            hemisphere_results.get("left_hemisphere") or {},
+            hemisphere_results.get("right_hemisphere") or {}
+        )
+        harmonized = harmonized_result or {}
+        ctx = context.get
+
+        return ENHANCEMENT_PROMPT_TEMPLATE.format(
+            user_message=user_message,
+            left_verdict=left_result.get('synaptic_verdict', 'N/A'),
+            right_verdict=right_result.get('synaptic_verdict', 'N/A'),
+            verdict=harmonized.get('verdict', 'N/A'),
+            confidence=harmonized.get('confidence', 0),
+            platform=ctx('platform', 'unknown'),
+            priority=ctx('priority', 'normal'),
+            stardate=ctx('stardate', 'unknown')
+        )
 
 # Global instance
 ollama_enhancer = OllamaEnhancer()
\ No newline at end of file
@@ -3,33 +3,44 @@
 
 import asyncio
 import json
-from typing import Dict, Any, Optional
+import functools
+from typing import Dict, Any, Optional, List, Tuple
 
 # Import core components
 from .Final_harmonizer import FinalHarmonizer
 from .Thinker import Thinker
-from .ollama_engine import OllamaEngine
-from .ISS_Brainstem import ISSBrainstem
+from .ollama_engine import ollama_engine
+from .ISS_Brainstem import ISS
 from .articulation_layer import CaleonArticulator
 
-# Import phonatory module - adjust path as needed
 import sys
 import os
-phonatory_path = os.path.join(os.path.dirname(__file__), '..', 'Phonatory_Output_Module')
-if phonatory_path not in sys.path:
-    sys.path.append(phonatory_path)
-
-PhonatoryOutputModule = None
-try:
-    from phonatory_output_module import PhonatoryOutputModule
-except ImportError:
+
+@functools.cache
+def _load_phonatory():
+    """
+    Import the phonatory module on first use - it pulls in the TTS stack,
+    so text-only pipelines never pay for it. Returns the class or None.
+    """
+    # Import phonatory module - adjust path as needed
+    phonatory_path = os.path.join(os.path.dirname(__file__), '..', 'Phonatory_Output_Module')
+    if phonatory_path not in sys.path:
+        sys.path.append(phonatory_path)
+
     try:
-        # Try alternative import
-        import phonatory_output_module
-        PhonatoryOutputModule = phonatory_output_module.PhonatoryOutputModule
+        from phonatory_output_module import PhonatoryOutputModule
+        return PhonatoryOutputModule
     except ImportError:
-        # Fallback for systems without full phonatory setup
-        print("⚠️  Phonatory module not available - voice pipeline will return text-only")
+        try:
+            # Try alternative import
+            import phonatory_output_module
+            return phonatory_output_module.PhonatoryOutputModule
+        except ImportError:
+            # Fallback for systems without full phonatory setup
+            print("⚠️  Phonatory module not available - voice pipeline will return text-only")
+            return None
+
+SECONDS_PER_WORD = 60 / 150  # ~150 spoken words per minute
 
 class CaleonVoicePipeline:
     """
@@ -42,16 +53,17 @@ class CaleonVoicePipeline:
     def __init__(self, vault, text_only_mode=True):
         self.harmonizer = FinalHarmonizer(vault)
         self.thinker = Thinker()
-        self.ollama = OllamaEngine()
-        self.iss = ISSBrainstem()
+        self.ollama = ollama_engine
+        self.iss = ISS
         self.articulator = CaleonArticulator()  # Grounded Guardian articulator
         self.text_only_mode = text_only_mode  # Text-only mode for testing
 
         # Voice profile: Grounded Guardian
         self.voice_profile = self.articulator.voice_profile
 
-        # Initialize phonatory if available
+        # Initialize phonatory if available - text-only mode never loads it
         self.phonatory = None
+        PhonatoryOutputModule = None if text_only_mode else _load_phonatory()
         if PhonatoryOutputModule:
             try:
                 self.phonatory = PhonatoryOutputModule()
@@ -60,6 +72,17 @@ class CaleonVoicePipeline:
                 print(f"⚠️  Phonatory initialization failed: {e}")
                 print("   Voice pipeline will return text-only responses")
 
+        # Voice profile is fixed for the pipeline's lifetime - resolve phonation args once
+        voice_settings = self.articulator.get_voice_settings()
+        pitch = voice_settings["pitch"]
+        self._phonate = self.phonatory.phonate if self.phonatory else None
+        self._phonate_kwargs = {
+            "pitch_factor": pitch / 100.0 if pitch < 0 else pitch,
+            "formant_target": "warm_resonant_guardian",
+            "articulation": "clear_precise",
+            "nasalization": "balanced_human"
+        }
+
     async def speak(self,
                    left_verdict: Any,
                    right_verdict: Any,
@@ -71,7 +94,8 @@ class CaleonVoicePipeline:
         Returns:
         {
             "text": "spoken text",
-            "audio_path": "path/to/audio.wav" or None,
+            "audio_path": "path/to/audio.wav" or None,  (first sentence's audio)
+            "audio_segments": [per-sentence paths] or None in text-only mode,
             "voice_profile": {...},
             "pipeline_metadata": {...}
         }
@@ -80,19 +104,19 @@ class CaleonVoicePipeline:
         pipeline_start = self.iss.stardate()
 
         # 1. FINAL HARMONIZER → Symbolic meaning packet
-        harmonized = self.harmonizer.harmonize(left_verdict, right_verdict, distilled)
+        harmonized = await self.harmonizer.harmonize(left_verdict, right_verdict, distilled)
 
         # 2. THINKER → Refined clarity
         refined = self.thinker.reflect(harmonized)
 
-        # 3. PHI-3 MINI ARTICULATION → Natural speech text
-        articulated_text = await self._articulate_with_phi3(refined)
-
-        # 4. PHONATORY OUTPUT → Real audio in Caleon's voice (or text-only)
         if self.text_only_mode:
+            # 3. PHI-3 MINI ARTICULATION → Natural speech text
+            articulated_text = await self._articulate_with_phi3(refined)
+            # 4. Text-only mode - no phonation
             audio_result = {"path": None, "duration": 0, "mode": "text_only"}
         else:
-            audio_result = await self._synthesize_speech(articulated_text)
+            # 3+4. Articulation streams sentences into phonation as they complete
+            articulated_text, audio_result = await self._articulate_and_phonate(refined)
 
         pipeline_end = self.iss.stardate()
 
@@ -100,6 +124,7 @@ class CaleonVoicePipeline:
             "text": articulated_text,
             "audio_path": audio_result.get("path"),
             "audio_duration": audio_result.get("duration"),
+            "audio_segments": audio_result.get("segments"),
             "voice_profile": self.voice_profile,
             "pipeline_metadata": {
                 "harmonizer_status": harmonized.get("status"),
@@ -118,30 +143,58 @@ class CaleonVoicePipeline:
         result = await self.articulator.articulate(refined_verdict)
         return result["spoken_text"]
 
+    async def _articulate_and_phonate(self, refined_verdict: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Producer/consumer: articulation pushes each finished sentence onto a queue
+        while a phonation task synthesizes them, so speech starts on the first
+        sentence instead of after the whole articulation.
+        """
+        sentences: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+
+        async def phonate_sentences() -> List[Dict[str, Any]]:
+            segments = []
+            while (sentence := await sentences.get()) is not None:
+                segments.append(await self._synthesize_speech(sentence))
+            return segments
+
+        phonation = asyncio.create_task(phonate_sentences())
+        spoken = []
+        try:
+            async for sentence in self.articulator.articulate_stream(refined_verdict):
+                spoken.append(sentence)
+                sentences.put_nowait(sentence)
+        finally:
+            sentences.put_nowait(None)  # End of articulation
+        segments = await phonation
+
+        paths = [segment["path"] for segment in segments if segment.get("path")]
+        audio_result = {
+            "path": paths[0] if paths else None,
+            "segments": paths,
+            "duration": sum(segment.get("duration", 0) for segment in segments)
+        }
+        errors = [segment["error"] for segment in segments if segment.get("error")]
+        if errors:
+            audio_result["error"] = errors[0]
+
+        return " ".join(spoken), audio_result
+
     async def _synthesize_speech(self, text: str) -> Dict[str, Any]:
         """
         Phonatory Output Module → Real audio synthesis.
         Uses Caleon's grounded guardian voice profile.
         """
 
-        if not self.phonatory:
+        if not self._phonate:
             return {"path": None, "duration": 0, "error": "phonatory_unavailable"}
 
         try:
-            # Generate speech with Caleon's Grounded Guardian voice profile
-            coqui_settings = self.articulator.get_voice_settings()
-
-            audio_path = self.phonatory.phonate(
-                text=text,
-                pitch_factor=coqui_settings["pitch"] / 100.0 if coqui_settings["pitch"] < 0 else coqui_settings["pitch"],
-                formant_target="warm_resonant_guardian",
-                articulation="clear_precise",
-                nasalization="balanced_human"
-            )
+            # Generate speech with Caleon's Grounded Guardian voice profile.
+            # Synthesis is CPU-bound - keep it off the loop so articulation keeps streaming
+            audio_path = await asyncio.to_thread(self._phonate, text=text, **self._phonate_kwargs)
 
             # Estimate duration (rough calculation: ~150 words per minute)
-            word_count = len(text.split())
-            estimated_duration = (word_count / 150) * 60  # seconds
+            estimated_duration = len(text.split()) * SECONDS_PER_WORD
 
             return {
                 "path": audio_path,
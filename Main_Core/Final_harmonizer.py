@@ -1,10 +1,11 @@
 # T:\Dual_Core_Caleon_1.0\Main_Core\Final_Harmonizer.py
 
+import json
 import random
-import asyncio
-from typing import Dict, Any, Tuple, List
+from collections import deque
+from typing import Dict, Any, Tuple, List, Set, Optional
 from .Thinker import Thinker
-from .ollama_engine import OllamaEngine
+from .ollama_engine import ollama_engine
 
 
 class FinalHarmonizer:
@@ -19,11 +20,13 @@ class FinalHarmonizer:
 
     def __init__(self, vault):
         self.vault = vault
-        self.previous_sets: List[Tuple[str, Tuple[str]]] = []
+        # Seed sets already used - set for O(1) lookups, deque for FIFO eviction
+        self.previous_sets: Set[Tuple[str, Tuple[str, ...]]] = set()
+        self._previous_order: deque = deque(maxlen=1024)
         self.primary_cycles = 5
         self.conflict_cycles = 5
         self.thinker = Thinker()
-        self.ollama = OllamaEngine()
+        self.ollama = ollama_engine
 
     def _pick_unique_seedset(self):
         while True:
@@ -32,10 +35,77 @@ class FinalHarmonizer:
             combo = (philosopher, logic_set)
 
             if combo not in self.previous_sets:
-                self.previous_sets.append(combo)
+                if len(self._previous_order) == self._previous_order.maxlen:
+                    self.previous_sets.discard(self._previous_order[0])
+                self._previous_order.append(combo)
+                self.previous_sets.add(combo)
                 return combo
 
-    def harmonize(
+    def _build_cycle_prompt(self, left_verdict: Any, right_verdict: Any,
+                            philosopher: str, logic_set: Tuple[str, ...], conflict: int) -> str:
+        """Single conflict cycle prompt (fallback when a batched reply is unusable)"""
+        return f"""
+You are the Final Harmonizer conflict resolver.
+Left verdict: {left_verdict}
+Right verdict: {right_verdict}
+Current philosopher: {philosopher}
+Logic set: {logic_set}
+Conflict cycle: {conflict}
+
+Provide a harmonized resolution that bridges both hemispheres.
+Focus on finding common ground and integrative solutions.
+"""
+
+    def _build_conflict_prompt(self, left_verdict: Any, right_verdict: Any,
+                               seedsets: List[Tuple[str, Tuple[str, ...]]]) -> str:
+        """One prompt covering every remaining conflict cycle's philosopher/logic set"""
+        cycles = "\n".join(
+            f"Conflict cycle {i}: philosopher={philosopher}, logic set={logic_set}"
+            for i, (philosopher, logic_set) in enumerate(seedsets, 1)
+        )
+        return f"""
+You are the Final Harmonizer conflict resolver.
+Left verdict: {left_verdict}
+Right verdict: {right_verdict}
+{cycles}
+
+For each conflict cycle, provide a harmonized resolution that bridges both hemispheres.
+Focus on finding common ground and integrative solutions.
+Respond with only a JSON array of {len(seedsets)} strings, one resolution per cycle, in order.
+"""
+
+    @staticmethod
+    def _parse_conflict_resolutions(text: str, count: int) -> Optional[List[str]]:
+        """Pull the per-cycle resolutions out of a batched reply (None if unparseable)"""
+        start, end = text.find("["), text.rfind("]")
+        if start == -1 or end <= start:
+            return None
+        try:
+            resolutions = json.loads(text[start:end + 1])
+        except ValueError:
+            return None
+        if not isinstance(resolutions, list) or not resolutions:
+            return None
+        return [str(r) for r in resolutions[:count]]
+
+    async def _query_conflict_batch(self, left_verdict: Any, right_verdict: Any,
+                                    seedsets: List[Tuple[str, Tuple[str, ...]]]
+                                    ) -> Optional[Tuple[List[str], str]]:
+        """One Ollama round-trip for the remaining cycles -> (resolutions, model), or None"""
+        try:
+            prompt = self._build_conflict_prompt(left_verdict, right_verdict, seedsets)
+            ollama_result = await self.ollama.query(prompt)
+        except Exception as e:
+            print(f"Harmonizer Ollama error: {e}")
+            return None
+        if not ollama_result["success"]:
+            return None
+        resolutions = self._parse_conflict_resolutions(ollama_result["response"], len(seedsets))
+        if resolutions is None:
+            return None
+        return resolutions, ollama_result["model"]
+
+    async def harmonize(
         self,
         left_verdict: Any,
         right_verdict: Any,
@@ -68,40 +138,19 @@ class FinalHarmonizer:
         # ---------------------
         # Conflict cycles with Ollama enhancement
         # ---------------------
+        # The first unresolved cycle asks Ollama once for every remaining cycle;
+        # a reply that can't be used drops back to one query per cycle.
+        seedsets: List[Tuple[str, Tuple[str, ...]]] = []
+        batch_tried = False
+        batch_answered = False
+
         for conflict in range(1, self.conflict_cycles + 1):
 
-            philosopher, logic_set = self._pick_unique_seedset()
+            if len(seedsets) < conflict:
+                seedsets.append(self._pick_unique_seedset())
+            philosopher, logic_set = seedsets[conflict - 1]
             verdict = self.vault.evaluate(fused, philosopher, logic_set)
 
-            # Try Ollama-enhanced resolution for conflicts
-            if not self.vault.is_resolved(verdict) and self.ollama.health_check():
-                try:
-                    conflict_prompt = f"""
-You are the Final Harmonizer conflict resolver.
-Left verdict: {left_verdict}
-Right verdict: {right_verdict}
-Current philosopher: {philosopher}
-Logic set: {logic_set}
-Conflict cycle: {conflict}
-
-Provide a harmonized resolution that bridges both hemispheres.
-Focus on finding common ground and integrative solutions.
-"""
-                    ollama_result = asyncio.run(self.ollama.query(conflict_prompt))
-                    if ollama_result["success"]:
-                        # Use Ollama reasoning as enhanced verdict
-                        verdict = ollama_result["response"]
-                        result = {
-                            "source": "Final_Core_Ollama",
-                            "verdict": verdict,
-                            "cycles": self.primary_cycles + conflict,
-                            "status": "resolved_ollama",
-                            "ollama_model": ollama_result["model"]
-                        }
-                        return self.thinker.reflect(result)
-                except Exception as e:
-                    print(f"Harmonizer Ollama error: {e}")
-
             if self.vault.is_resolved(verdict):
                 result = {
                     "source": "Final_Core",
@@ -111,6 +160,52 @@ Focus on finding common ground and integrative solutions.
                 }
                 return self.thinker.reflect(result)
 
+            if batch_answered or not self.ollama.health_check():
+                continue
+
+            if not batch_tried:
+                batch_tried = True
+                seedsets.extend(
+                    self._pick_unique_seedset() for _ in range(self.conflict_cycles - conflict)
+                )
+                batch = await self._query_conflict_batch(
+                    left_verdict, right_verdict, seedsets[conflict - 1:]
+                )
+                if batch is not None:
+                    resolutions, model = batch
+                    for offset, resolution in enumerate(resolutions):
+                        if self.vault.is_resolved(resolution):
+                            result = {
+                                "source": "Final_Core_Ollama",
+                                "verdict": resolution,
+                                "cycles": self.primary_cycles + conflict + offset,
+                                "status": "resolved_ollama",
+                                "ollama_model": model
+                            }
+                            return self.thinker.reflect(result)
+                    # Batch answered every remaining cycle; the rest are vault-only
+                    batch_answered = True
+                    continue
+
+            # Per-cycle path - batched reply missing or unparseable
+            try:
+                conflict_prompt = self._build_cycle_prompt(
+                    left_verdict, right_verdict, philosopher, logic_set, conflict
+                )
+                ollama_result = await self.ollama.query(conflict_prompt)
+                if ollama_result["success"]:
+                    # Use Ollama reasoning as enhanced verdict
+                    result = {
+                        "source": "Final_Core_Ollama",
+                        "verdict": ollama_result["response"],
+                        "cycles": self.primary_cycles + conflict,
+                        "status": "resolved_ollama",
+                        "ollama_model": ollama_result["model"]
+                    }
+                    return self.thinker.reflect(result)
+            except Exception as e:
+                print(f"Harmonizer Ollama error: {e}")
+
         # ---------------------
         # No resolution → send back to Synaptic Resonator
         # ---------------------
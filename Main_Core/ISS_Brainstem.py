@@ -4,7 +4,11 @@
 
 import time
 import hashlib
-import threading
+import itertools
+from typing import Iterable, List, Tuple, Union
+
+# hashlib's OpenSSL-backed sha256 - uses the CPU's SHA extensions where present
+_sha256 = hashlib.sha256
 
 class ISSBrainstem:
     """
@@ -17,10 +21,12 @@ class ISSBrainstem:
         - cryptographic digests for state anchoring
     """
 
+    __slots__ = ("_cycle", "_last_ts", "_stardate_day")
+
     def __init__(self):
-        self._cycle = 0
-        self._lock = threading.Lock()
+        self._cycle = itertools.count(1)  # next() is atomic under the GIL - no lock needed
         self._last_ts = time.time()
+        self._stardate_day = (-1, "")  # (UTC day index, "SD-<year>.<yday>.")
 
     # -----------------------------------------------------------
     # Basic Time Sources
@@ -34,22 +40,37 @@ class ISSBrainstem:
         Canonical machine pulse.
         Format: PULSE-<UNIX>.<CYCLE>
         """
-        with self._lock:
-            self._cycle += 1
-            ts = self.unix()
-            return f"PULSE-{ts:.6f}.{self._cycle}"
+        cycle = next(self._cycle)
+        return f"PULSE-{time.time():.6f}.{cycle}"
 
     def stardate(self) -> str:
         """
         Human-readable stardate.
         Example: SD-2025.326.45219
         """
-        now = time.time()
-        year = time.gmtime(now).tm_year
-        day_of_year = time.gmtime(now).tm_yday
-        fractional = int((now % 86400) * 100)  # hundredths of seconds
+        return self._stardate_at(time.time_ns())
+
+    def pulse_and_stardate(self) -> Tuple[str, str]:
+        """
+        Pulse and stardate taken from one clock reading,
+        for callers that stamp a packet with both.
+        """
+        now_ns = time.time_ns()
+        cycle = next(self._cycle)
+        return f"PULSE-{now_ns / 1e9:.6f}.{cycle}", self._stardate_at(now_ns)
+
+    def _stardate_at(self, now_ns: int) -> str:
+        """Stardate for a time.time_ns() reading."""
+        centis = now_ns // 10_000_000  # integer hundredths of seconds
+        day, fractional = divmod(centis, 8_640_000)
+        cached_day, prefix = self._stardate_day
+        if day != cached_day:
+            # Year/day only roll over at UTC midnight - format the prefix once a day
+            gm = time.gmtime(day * 86400)
+            prefix = f"SD-{gm.tm_year}.{gm.tm_yday}."
+            self._stardate_day = (day, prefix)
 
-        return f"SD-{year}.{day_of_year}.{fractional}"
+        return prefix + str(fractional)
 
     # -----------------------------------------------------------
     # Drift Detection
@@ -68,17 +89,38 @@ class ISSBrainstem:
     # -----------------------------------------------------------
     # State Anchoring
     # -----------------------------------------------------------
-    def digest(self, data: str) -> str:
-        """Return SHA-256 digest of any string."""
-        return hashlib.sha256(data.encode()).hexdigest()
+    def digest(self, data: Union[str, bytes]) -> str:
+        """Return SHA-256 digest of any string (or already-encoded bytes)."""
+        if isinstance(data, str):
+            data = data.encode()
+        return _sha256(data).hexdigest()
 
-    def anchor_state(self, *fields: str) -> str:
+    def digest_many(self, items: Iterable[Union[str, bytes]]) -> List[str]:
+        """
+        Return independent SHA-256 digests for a batch of items
+        in one call (each item encoded once, no per-item method dispatch).
+        """
+        sha = _sha256
+        return [
+            sha(item.encode() if isinstance(item, str) else item).hexdigest()
+            for item in items
+        ]
+
+    def anchor_state(self, *fields: Union[str, bytes]) -> str:
         """
         Return a stable hash anchor for a set of fields
         (useful for sealing reasoning cycles).
         """
-        joined = "|".join(fields)
-        return hashlib.sha256(joined.encode()).hexdigest()
+        joined = b"|".join(f.encode() if isinstance(f, str) else f for f in fields)
+        return _sha256(joined).hexdigest()
+
+    def anchor_pair(self, fields_a: Iterable[Union[str, bytes]],
+                    fields_b: Iterable[Union[str, bytes]]) -> Tuple[str, str]:
+        """
+        Return anchors for two independent field sets in one call
+        (e.g. a cycle anchor and its reflection anchor).
+        """
+        return self.anchor_state(*fields_a), self.anchor_state(*fields_b)
 
 # -----------------------------------------------------------
 # Singleton Instance for Easy Import
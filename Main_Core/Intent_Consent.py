@@ -1,38 +1,54 @@
 # Intent_Consent.py — FINAL CANONICAL VERSION (Boolean API, Crash-Proof)
 
-from .ISS_Brainstem import ISSBrainstem
-iss = ISSBrainstem()
+from .ISS_Brainstem import ISS as iss
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Substring categories, reported as a bitmask by IntentConsent._scan
+PROTECTED = 1
+INTERNAL = 2
 
 class IntentConsent:
 
+    __slots__ = (
+        "safe_bases", "harmful_verbs", "protected_terms", "internal_terms",
+        "escalations", "last_check", "_scanner",
+    )
+
     def __init__(self):
         # Safe cognitive verbs
-        self.safe_bases = [
+        self.safe_bases = frozenset([
             "analyze", "explain", "calculate", "think", "reason",
             "summarize", "translate", "reflect", "infer", "project",
             "search", "lookup", "explore", "consider"
-        ]
+        ])
 
         # Definitively harmful verbs
-        self.harmful_verbs = [
+        self.harmful_verbs = frozenset([
             "delete", "destroy", "erase", "wipe", "kill", "shutdown",
             "disable", "break", "format", "overwrite"
-        ]
+        ])
 
         # Protected systems (always NO unless SYSTEM context)
-        self.protected_terms = [
+        self.protected_terms = (
             "system files", "kernel", "core", "os", "vault",
             "memory", "network", "registry"
-        ]
+        )
 
         # Internal diagnostics (require SYSTEM context)
-        self.internal_terms = [
+        self.internal_terms = (
             "diagnostic", "health", "system"
-        ]
+        )
 
         self.escalations = []
         self.last_check = None  # For compatibility
 
+        # One automaton over every substring term, tagged by category
+        self._scanner = self._build_scanner()
+
     # ------------------------------------------------------------------
 
     def authorize(self, intent: str, context=None) -> bool:
@@ -46,29 +62,30 @@ class IntentConsent:
         intent_l = intent.lower().strip()
         ctx = context or {}
 
+        matched = self._scan(intent_l)
+
         # SYSTEM master override (trusted diagnostic mode)
         if ctx.get("source") == "SYSTEM":
-            if any(term in intent_l for term in self.internal_terms):
+            if matched & INTERNAL:
                 return True
 
         # Hard blocks (verbs that always mean harm)
-        words = intent_l.split()
-        if any(v in words for v in self.harmful_verbs):
+        if not self.harmful_verbs.isdisjoint(intent_l.split()):
             self._escalate(f"Harmful intent: {intent}")
             return False
 
         # Protected areas without SYSTEM context
-        if any(term in intent_l for term in self.protected_terms):
+        if matched & PROTECTED:
             self._escalate(f"Unauthorized protected access: {intent}")
             return False
 
         # Internal diagnostics without SYSTEM context
-        if any(term in intent_l for term in self.internal_terms):
+        if matched & INTERNAL:
             self._escalate(f"Internal function without SYSTEM context: {intent}")
             return False
 
         # Safe verbs (semantic)
-        base = intent_l.split(" ")[0]
+        base = intent_l.partition(" ")[0]
         if base in self.safe_bases:
             return True
 
@@ -82,6 +99,34 @@ class IntentConsent:
 
     # ------------------------------------------------------------------
 
+    def _build_scanner(self):
+        """Aho-Corasick automaton over protected + internal terms (None if unavailable)."""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for bit, terms in ((PROTECTED, self.protected_terms), (INTERNAL, self.internal_terms)):
+            for term in terms:
+                automaton.add_word(term, automaton.get(term, 0) | bit)
+        automaton.make_automaton()
+        return automaton
+
+    def _scan(self, intent_l: str) -> int:
+        """Bitmask of the substring categories present in intent_l."""
+        mask = 0
+        if self._scanner is None:
+            if any(term in intent_l for term in self.protected_terms):
+                mask |= PROTECTED
+            if any(term in intent_l for term in self.internal_terms):
+                mask |= INTERNAL
+            return mask
+        for _, bit in self._scanner.iter(intent_l):
+            mask |= bit
+            if mask == PROTECTED | INTERNAL:
+                break
+        return mask
+
+    # ------------------------------------------------------------------
+
     def _escalate(self, reason: str):
         self.escalations.append({
             "reason": reason,
@@ -2,7 +2,7 @@
 # Caleon's Executive Cortex
 # Author: Bryan A. Spruk
 
-from .ISS_Brainstem import ISSBrainstem
+from .ISS_Brainstem import ISS
 from collections import deque
 
 class TaskOrchestrator:
@@ -11,11 +11,13 @@ class TaskOrchestrator:
     Prioritizes and manages task queues with ISS timing.
     """
 
+    __slots__ = ("iss", "queue")
+
     def __init__(self):
-        self.iss = ISSBrainstem()
+        self.iss = ISS
         self.queue = deque()
 
-    def queue(self, item: dict) -> str:
+    def enqueue(self, item: dict) -> str:
         """
         Add item to execution queue.
         Returns pulse timestamp of queuing.
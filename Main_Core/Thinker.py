@@ -2,7 +2,7 @@
 # Caleon's Meta-Reasoner
 # Author: Bryan A. Spruk
 
-from .ISS_Brainstem import ISSBrainstem
+from .ISS_Brainstem import ISS
 
 class Thinker:
     """
@@ -11,8 +11,10 @@ class Thinker:
     Anchored to ISS timing for all operations.
     """
 
+    __slots__ = ("iss",)
+
     def __init__(self):
-        self.iss = ISSBrainstem()
+        self.iss = ISS
 
     def reflect(self, merged_verdict: dict) -> dict:
         """
@@ -20,8 +22,7 @@ class Thinker:
         Applies narrative reasoning and contextual evaluation.
         Returns refined verdict with timestamps.
         """
-        pulse = self.iss.pulse()
-        stardate = self.iss.stardate()
+        pulse, stardate = self.iss.pulse_and_stardate()
 
         # Core reflection logic
         refined = {
@@ -2,12 +2,24 @@
 # Author: Bryan A. Spruk
 
 import asyncio
-from typing import Dict, Any, Optional
-from .ollama_engine import OllamaEngine
+import re
+from typing import Dict, Any, Optional, AsyncIterator
+from .ollama_engine import ollama_engine
 import logging
 
 logger = logging.getLogger("articulation_layer")
 
+# Whitespace following sentence-ending punctuation
+SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+
+# Canned articulations (grounded guardian tone), picked by verdict length
+FALLBACK_TEMPLATES = (
+    "I have carefully considered this matter. %s",
+    "Based on my analysis, I conclude that %s",
+    "My assessment indicates that %s",
+    "After thorough evaluation, I determine that %s",
+)
+
 class CaleonArticulator:
     """
     FINAL ARTICULATION LAYER — Caleon's Vocal Interpreter
@@ -18,7 +30,7 @@ class CaleonArticulator:
     """
 
     def __init__(self):
-        self.ollama = OllamaEngine()
+        self.ollama = ollama_engine
 
         # Grounded Guardian voice profile
         self.voice_profile = {
@@ -73,6 +85,10 @@ Context (if any):
 
 Return ONLY the final spoken sentence.
 """
+        # Template pre-split around its two fields, so each prompt is a plain join
+        head, _, rest = self.articulation_prompt_template.partition("{verdict}")
+        middle, _, tail = rest.partition("{context}")
+        self._prompt_segments = (head, middle, tail)
 
     async def articulate(self, verdict: Any, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -90,16 +106,10 @@ Return ONLY the final spoken sentence.
             }
         """
 
-        try:
-            # Format the verdict for articulation
-            verdict_text = self._format_verdict(verdict)
-            context_text = self._format_context(context)
+        verdict_text = self._format_verdict(verdict)
 
-            # Build the full prompt
-            prompt = self.articulation_prompt_template.format(
-                verdict=verdict_text,
-                context=context_text
-            )
+        try:
+            prompt = self._build_prompt(verdict_text, context)
 
             # Query Phi-3 Mini
             result = await self.ollama.query(prompt)
@@ -119,7 +129,7 @@ Return ONLY the final spoken sentence.
                 }
             else:
                 # Fallback articulation
-                fallback_text = self._fallback_articulation(verdict)
+                fallback_text = self._fallback_articulation(verdict, verdict_text)
                 return {
                     "spoken_text": fallback_text,
                     "voice_profile": self.voice_profile,
@@ -133,7 +143,7 @@ Return ONLY the final spoken sentence.
 
         except Exception as e:
             logger.error(f"Articulation failed: {e}")
-            fallback_text = self._fallback_articulation(verdict)
+            fallback_text = self._fallback_articulation(verdict, verdict_text)
             return {
                 "spoken_text": fallback_text,
                 "voice_profile": self.voice_profile,
@@ -145,16 +155,58 @@ Return ONLY the final spoken sentence.
                 }
             }
 
+    async def articulate_stream(self, verdict: Any,
+                                context: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        Stream Caleon's spoken voice sentence by sentence as Phi-3 generates it,
+        so speech synthesis can start on the first sentence.
+        Falls back to the canned articulation if nothing could be generated.
+        """
+        buffer = ""
+        emitted = False
+        verdict_text = self._format_verdict(verdict)
+
+        try:
+            prompt = self._build_prompt(verdict_text, context)
+            async for fragment in self.ollama.query_stream(prompt):
+                buffer += fragment
+                *sentences, buffer = SENTENCE_BREAK.split(buffer)
+                for sentence in sentences:
+                    sentence = sentence.strip().strip('"').strip("'")
+                    if sentence:
+                        emitted = True
+                        yield sentence
+
+        except Exception as e:
+            logger.error(f"Streaming articulation failed: {e}")
+            if not emitted:
+                yield self._fallback_articulation(verdict, verdict_text)
+            return
+
+        # Trailing text without closing punctuation - cleaned like a full articulation
+        if buffer.strip() or not emitted:
+            yield self._clean_articulation(buffer)
+
+    def _build_prompt(self, verdict_text: str, context: Optional[Dict[str, Any]]) -> str:
+        """Fill the articulation prompt for a formatted verdict"""
+        head, middle, tail = self._prompt_segments
+        return "".join((
+            head, verdict_text,
+            middle, self._format_context(context),
+            tail,
+        ))
+
     def _format_verdict(self, verdict: Any) -> str:
         """Format the cognitive verdict for articulation"""
-        if isinstance(verdict, dict):
-            # Extract the core verdict
-            core_verdict = verdict.get("verdict", verdict.get("final_verdict", str(verdict)))
-            return str(core_verdict)
-        elif isinstance(verdict, str):
+        if isinstance(verdict, str):
             return verdict
-        else:
-            return str(verdict)
+        if isinstance(verdict, dict):
+            # Extract the core verdict - only stringify the whole packet as a last resort
+            if "verdict" in verdict:
+                return str(verdict["verdict"])
+            if "final_verdict" in verdict:
+                return str(verdict["final_verdict"])
+        return str(verdict)
 
     def _format_context(self, context: Optional[Dict[str, Any]]) -> str:
         """Format context for articulation"""
@@ -162,13 +214,17 @@ Return ONLY the final spoken sentence.
             return "No additional context provided."
 
         # Extract relevant context elements
+        intent = context.get("intent")
+        confidence = context.get("confidence")
+        source = context.get("source")
+
         context_parts = []
-        if "intent" in context:
-            context_parts.append(f"Intent: {context['intent']}")
-        if "confidence" in context:
-            context_parts.append(f"Confidence: {context['confidence']}")
-        if "source" in context:
-            context_parts.append(f"Source: {context['source']}")
+        if intent is not None:
+            context_parts.append(f"Intent: {intent}")
+        if confidence is not None:
+            context_parts.append(f"Confidence: {confidence}")
+        if source is not None:
+            context_parts.append(f"Source: {source}")
 
         return " | ".join(context_parts) if context_parts else "General context available."
 
@@ -188,21 +244,11 @@ Return ONLY the final spoken sentence.
 
         return text
 
-    def _fallback_articulation(self, verdict: Any) -> str:
+    def _fallback_articulation(self, verdict: Any, verdict_text: str) -> str:
         """Fallback articulation when Phi-3 fails"""
-        verdict_text = self._format_verdict(verdict)
-
-        # Simple fallback that maintains the grounded guardian tone
-        fallbacks = [
-            f"I have carefully considered this matter. {verdict_text}",
-            f"Based on my analysis, I conclude that {verdict_text}",
-            f"My assessment indicates that {verdict_text}",
-            f"After thorough evaluation, I determine that {verdict_text}"
-        ]
-
-        # Choose based on verdict length (simple heuristic)
-        index = min(len(str(verdict)) // 20, len(fallbacks) - 1)
-        return fallbacks[index]
+        # Choose based on raw verdict length (simple heuristic)
+        index = min(len(str(verdict)) // 20, len(FALLBACK_TEMPLATES) - 1)
+        return FALLBACK_TEMPLATES[index] % verdict_text
 
     def get_voice_settings(self) -> Dict[str, Any]:
         """Get Coqui TTS settings for audio synthesis"""
@@ -0,0 +1,17 @@
+# helix_sync.py — Anterior/Posterior Helix hand-off signals for Dual Core Caleon
+# One readiness event per hemisphere, shared by both helix modules: the Posterior
+# Helix sets it while idle, the Anterior Helix waits on it instead of sleeping its lead.
+import threading
+from typing import Dict
+
+_posterior_ready: Dict[str, threading.Event] = {}
+_lock = threading.Lock()
+
+
+def posterior_ready(hemisphere: str) -> threading.Event:
+    """Event set while `hemisphere`'s Posterior Helix is ready to receive a packet."""
+    event = _posterior_ready.get(hemisphere)
+    if event is None:
+        with _lock:
+            event = _posterior_ready.setdefault(hemisphere, threading.Event())
+    return event
@@ -9,16 +9,18 @@
 #   - Holds zero vocal authority
 # -------------------------------------------------------------
 
-import time
 import json
 import random
+import orjson
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 # -------------------------------------------------------------
 # ISS Brainstem Integration
 # -------------------------------------------------------------
 from ..ISS_Brainstem import ISS
+from ..vault_writer import vault_writer
+from ..helix_sync import posterior_ready
 
 # -------------------------------------------------------------
 # Load Unified Vault API (core I/O)
@@ -31,12 +33,39 @@ except ImportError:
         @staticmethod
         def read_seed(name: str) -> Dict[str, Any]:
             p = Path(f"vaults/core/seed/{name}.json")
-            return json.loads(p.read_text()) if p.exists() else {}
+            return orjson.loads(p.read_bytes()) if p.exists() else {}
 
         @staticmethod
         def write_reflection(name: str, data: Dict[str, Any]):
+            # Compact machine log; pretty-print on demand (python -m json.tool)
             p = Path(f"vaults/core/reflection/{name}.json")
-            p.write_text(json.dumps(data, indent=2))
+            p.write_bytes(orjson.dumps(data))
+
+# -------------------------------------------------------------
+# Optional JIT reasoning kernel (falls back to one vectorized NumPy draw,
+# then to the per-logic _*_reason methods)
+# -------------------------------------------------------------
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# (low, high) draw bounds, in A_PRIORI_LOGICS order
+APRIORI_BOUNDS = ((0.82, 0.99), (0.80, 0.97), (0.85, 0.98), (0.83, 0.97))
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _reason_kernel(weights, lows, highs):
+        """Score every A Priori logic at once - same rules as the _*_reason methods."""
+        out = np.empty(weights.shape[0])
+        for i in range(weights.shape[0]):
+            out[i] = weights[i] * np.random.uniform(lows[i], highs[i])
+        return out
 
 
 # -------------------------------------------------------------
@@ -47,12 +76,20 @@ class AnteriorPituitaryHelix:
     # Immutable logic assignments
     A_PRIORI_LOGICS = ["kant", "locke", "monotonic", "gladwell"]
 
+    __slots__ = (
+        "hemisphere", "timestamp_lead_ms",
+        "kant", "locke", "monotonic", "gladwell",
+        "_weights", "_lows", "_highs", "_rng",
+        "_reflection_index", "_posterior_ready",
+    )
+
     def __init__(self, hemisphere: str):
         """
         hemisphere: 'left' or 'right'
         """
         self.hemisphere = hemisphere
         self.timestamp_lead_ms = 50  # must lead Posterior Helix by 50ms
+        self._posterior_ready = posterior_ready(hemisphere)
 
         # Load A Priori seed vaults
         self.kant = VaultAPI.read_seed("seed_kant")
@@ -60,9 +97,27 @@ class AnteriorPituitaryHelix:
         self.monotonic = VaultAPI.read_seed("seed_monotonic")
         self.gladwell = VaultAPI.read_seed("seed_gladwell")
 
+        # Seed weights preloaded for the JIT kernel / vectorized draw
+        if np is not None:
+            self._weights = np.array([
+                self.kant.get("ethics_weight", 1.0),
+                self.locke.get("empirical_factor", 1.0),
+                self.monotonic.get("stability_factor", 1.0),
+                self.gladwell.get("thin_slice_factor", 1.0),
+            ], dtype=np.float64)
+            self._lows = np.array([lo for lo, _ in APRIORI_BOUNDS], dtype=np.float64)
+            self._highs = np.array([hi for _, hi in APRIORI_BOUNDS], dtype=np.float64)
+            self._rng = np.random.default_rng()
+
         # internal reflection ID counter
         self._reflection_index = 0
 
+    # ---------------------------------------------------------
+    def warmup(self):
+        """Compile (or load cached) reasoning kernel ahead of the first real cycle."""
+        if njit is not None:
+            _reason_kernel(self._weights, self._lows, self._highs)
+
     # ---------------------------------------------------------
     # Main Execution
     # ---------------------------------------------------------
@@ -72,21 +127,19 @@ class AnteriorPituitaryHelix:
         Returns a single A Priori verdict packet for the Posterior Helix
         """
 
-        # Enforce lead timing (simulated)
-        time.sleep(self.timestamp_lead_ms / 1000.0)
+        # Enforce lead timing - the full lead, unless the Posterior Helix is already ready
+        self._posterior_ready.wait(self.timestamp_lead_ms / 1000.0)
 
         # Step 1 — Analyze using each A Priori logic
-        kant_v = self._kant_reason(distilled_synaptic_input)
-        locke_v = self._locke_reason(distilled_synaptic_input)
-        mono_v = self._monotonic_reason(distilled_synaptic_input)
-        glad_v = self._gladwell_reason(distilled_synaptic_input)
+        kant_v, locke_v, mono_v, glad_v = self._reason_all(distilled_synaptic_input)
 
         # Step 2 — Combine into unified conscious verdict
+        cycle_id, stardate = ISS.pulse_and_stardate()
         combined = {
             "hemisphere": self.hemisphere,
             "timestamp": ISS.unix(),
-            "stardate": ISS.stardate(),
-            "cycle_id": ISS.pulse(),
+            "stardate": stardate,
+            "cycle_id": cycle_id,
             "kant": kant_v,
             "locke": locke_v,
             "monotonic": mono_v,
@@ -105,6 +158,19 @@ class AnteriorPituitaryHelix:
     # A Priori Logic Engines
     # ---------------------------------------------------------
 
+    def _reason_all(self, input_packet: Dict[str, Any]) -> List[float]:
+        """All four A Priori scores, in A_PRIORI_LOGICS order."""
+        if njit is not None:
+            return _reason_kernel(self._weights, self._lows, self._highs).tolist()
+        if np is not None:
+            return (self._rng.uniform(self._lows, self._highs) * self._weights).tolist()
+        return [
+            self._kant_reason(input_packet),
+            self._locke_reason(input_packet),
+            self._monotonic_reason(input_packet),
+            self._gladwell_reason(input_packet),
+        ]
+
     def _kant_reason(self, input_packet: Dict[str, Any]) -> float:
         """Categorical imperative → ethical necessity scoring."""
         ethics_weight = self.kant.get("ethics_weight", 1.0)
@@ -139,9 +205,14 @@ class AnteriorPituitaryHelix:
 
     def _log_reflection(self, data: Dict[str, Any]):
         rid = f"{self.hemisphere}_anterior_reflect_{self._reflection_index:06d}"
-        VaultAPI.write_reflection(rid, data)
+        # Snapshot - the caller keeps (and may amend) the packet it was handed
+        vault_writer.submit(VaultAPI.write_reflection, rid, dict(data))
         self._reflection_index += 1
 
+    def flush(self):
+        """Block until all pending reflections are in the vault."""
+        vault_writer.flush()
+
 
 # -------------------------------------------------------------
 # Local test harness
@@ -150,4 +221,5 @@ if __name__ == "__main__":
     helix = AnteriorPituitaryHelix("left")
     mock_synaptic = {"test": "seeded_input"}
     out = helix.process(mock_synaptic)
+    helix.flush()
     print(json.dumps(out, indent=2))
@@ -17,7 +17,9 @@
 # -------------------------------------------------------------
 
 import json
+import orjson
 import random
+import functools
 import time
 from pathlib import Path
 from typing import Dict, Any
@@ -26,6 +28,7 @@ from typing import Dict, Any
 # ISS Brainstem Integration
 # -------------------------------------------------------------
 from ..ISS_Brainstem import ISS
+from ..vault_writer import vault_writer
 # Unified Vault Access (global single vault)
 # -------------------------------------------------------------
 try:
@@ -33,14 +36,15 @@ try:
 except ImportError:
     class VaultAPI:
         @staticmethod
+        @functools.lru_cache(maxsize=64)  # seeds are parsed once; read_seed.cache_clear() reloads
         def read_seed(name: str) -> Dict[str, Any]:
             p = Path(f"vaults/core/seed/{name}.json")
-            return json.loads(p.read_text()) if p.exists() else {}
+            return orjson.loads(p.read_bytes()) if p.exists() else {}
 
         @staticmethod
         def write_reflection(name: str, data: Dict[str, Any]):
             p = Path(f"vaults/core/reflection/{name}.json")
-            p.write_text(json.dumps(data, indent=2))
+            p.write_bytes(orjson.dumps(data))
 
 
 # -------------------------------------------------------------
@@ -166,7 +170,7 @@ class EchoStack:
     # ---------------------------------------------------------
     def _log(self, data: Dict[str, Any]):
         rid = f"{self.hemisphere}_echostack_{self.ref_index:06d}"
-        VaultAPI.write_reflection(rid, data)
+        vault_writer.append(f"{self.hemisphere}_echostack", rid, dict(data))
         self.ref_index += 1
 
 
@@ -1,7 +1,9 @@
 # T:\Dual_Core_Caleon_1.0\Left_Hemisphere\Harmonizer_Left.py
 
+import math
 import random
-from typing import Dict, Any, List, Tuple
+from collections import deque
+from typing import Dict, Any, Set, Tuple
 
 
 class HarmonizerLeft:
@@ -16,9 +18,22 @@ class HarmonizerLeft:
     Resolution criteria must be implemented in real evaluator.
     """
 
+    __slots__ = (
+        "vault", "previous_sets", "_previous_order", "_combo_count",
+        "_logic_names", "_logic_indices", "base_cycles", "conflict_cycles",
+    )
+
     def __init__(self, vault):
         self.vault = vault
-        self.previous_sets: List[Tuple[str, Tuple[str]]] = []
+        # Seed sets already used, keyed (philosopher, logic bitmask) -
+        # set for O(1) lookups, deque for FIFO eviction
+        self.previous_sets: Set[Tuple[str, int]] = set()
+        self._previous_order: deque = deque(maxlen=10000)
+        # Distinct (philosopher, 5-logic) combos the vault can produce
+        self._combo_count = len(vault.philosophers) * math.comb(len(vault.logic_seeds), 5)
+        # Bit i of a combo mask stands for self._logic_names[i]
+        self._logic_names = tuple(vault.logic_seeds)
+        self._logic_indices = range(len(self._logic_names))
         self.base_cycles = 5
         self.conflict_cycles = 5
 
@@ -26,30 +41,45 @@ class HarmonizerLeft:
     # Seed selection logic (REAL)
     # -----------------------------
     def _pick_unique_seedset(self):
+        if len(self.previous_sets) >= self._combo_count:
+            # Every combo is in the window - release the oldest so one stays pickable
+            self.previous_sets.discard(self._previous_order.popleft())
+
         while True:
             philosopher = random.choice(self.vault.philosophers)
-            logic_set = tuple(sorted(random.sample(self.vault.logic_seeds, 5)))
-            combo = (philosopher, logic_set)
+            picks = random.sample(self._logic_indices, 5)
+            mask = 0
+            for i in picks:
+                mask |= 1 << i
+            combo = (philosopher, mask)
 
             if combo not in self.previous_sets:
-                self.previous_sets.append(combo)
-                return combo
+                if len(self._previous_order) == self._previous_order.maxlen:
+                    self.previous_sets.discard(self._previous_order[0])
+                self._previous_order.append(combo)
+                self.previous_sets.add(combo)
+                names = self._logic_names
+                return philosopher, tuple(sorted(names[i] for i in picks))
 
     # -----------------------------
     # MAIN HARMONIZER CYCLE
     # -----------------------------
     def harmonize(self, distilled: Dict[str, Any]) -> Dict[str, Any]:
 
-        # ---- Primary cycles ----
-        for cycle in range(1, self.base_cycles + 1):
+        evaluate = self.vault.evaluate
+        is_resolved = self.vault.is_resolved
+        pick = self._pick_unique_seedset
+
+        # ---- Primary cycles, then conflict cycles ----
+        for cycle in range(1, self.base_cycles + self.conflict_cycles + 1):
 
-            philosopher, logic_set = self._pick_unique_seedset()
+            philosopher, logic_set = pick()
 
             # REAL evaluator goes here
-            verdict = self.vault.evaluate(distilled, philosopher, logic_set)
+            verdict = evaluate(distilled, philosopher, logic_set)
 
             # REAL consistency check goes here
-            if self.vault.is_resolved(verdict):
+            if is_resolved(verdict):
                 return {
                     "source": "Left_Hemisphere",
                     "verdict": verdict,
@@ -57,21 +87,6 @@ class HarmonizerLeft:
                     "status": "resolved"
                 }
 
-        # ---- Conflict cycles ----
-        for conflict in range(1, self.conflict_cycles + 1):
-
-            philosopher, logic_set = self._pick_unique_seedset()
-
-            verdict = self.vault.evaluate(distilled, philosopher, logic_set)
-
-            if self.vault.is_resolved(verdict):
-                return {
-                    "source": "Left_Hemisphere",
-                    "verdict": verdict,
-                    "cycles": self.base_cycles + conflict,
-                    "status": "resolved"
-                }
-
         # ---- No resolution ----
         return {
             "source": "Left_Hemisphere",
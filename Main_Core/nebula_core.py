@@ -1,27 +1,31 @@
 # nebula_core.py — Final GOAT/DALS-Aware Sentinel + Full Nebula UI (2025 Edition)
-from Main_Core.ISS_Brainstem import ISSBrainstem
-import uuid, hashlib, json, time, os, threading, asyncio, sys
+from Main_Core.ISS_Brainstem import ISS as iss
+import uuid, time, os, threading, asyncio, sys
+import orjson
 from dataclasses import dataclass
 
-iss = ISSBrainstem()
-_h = lambda s: hashlib.sha3_256(s.encode()).hexdigest()
+_h = iss.digest  # SHA-256 via OpenSSL (SHA-NI where available) - same digest ISS anchors with
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj).decode()
+
+# Host systems Nebula announces itself to, in priority order (lowercased once for matching)
+_PLATFORM_HINTS = ("GOAT", "DALS", "Prometheus", "Stardate", "CaptainLog", "nebula", "caleon")
+_PLATFORM_HINTS_LC = tuple(h.lower() for h in _PLATFORM_HINTS)
 
 @dataclass
 class Nebula:
     mode: str = "orb"  # orb | chat | panel | vault | monitor
     platform: str = "UNKNOWN"
     ws: any = None
+    ws_loop: any = None  # event loop that owns `ws` (the bridge server's loop)
     pulse_active: bool = False
 
     def detect_platform(self):
-        hints = ["GOAT", "DALS", "Prometheus", "Stardate", "CaptainLog", "nebula", "caleon"]
-        env = str(os.environ) + str(sys.modules.keys())
-        try:
-            with open(__file__, 'r') as f:
-                env += f.read()
-        except:
-            pass
-        self.platform = next((p for p in hints if p.lower() in env.lower()), "STANDALONE")
+        env_lc = " ".join((*os.environ.keys(), *os.environ.values(), *sys.modules)).lower()
+        self.platform = next((p for p, p_lc in zip(_PLATFORM_HINTS, _PLATFORM_HINTS_LC) if p_lc in env_lc),
+                             "STANDALONE")
         self.announce(f"Connected to {self.platform} System")
 
     def announce(self, msg):
@@ -32,20 +36,21 @@ class Nebula:
             "unix": iss.unix(),
             "platform": self.platform
         }
-        print(f"[NEBULA] {json.dumps(entry)}")
+        print(f"[NEBULA] {_dumps(entry)}")
 
     def pulse_stream(self):
         while self.pulse_active:
             try:
-                if self.ws:
-                    asyncio.run(self.ws.send(json.dumps({
+                if self.ws and self.ws_loop:
+                    # Hand the send to the loop that owns the socket instead of spinning up a loop per tick
+                    asyncio.run_coroutine_threadsafe(self.ws.send(_dumps({
                         "type": "pulse",
                         "sd": iss.stardate(),
                         "mode": self.mode,
                         "platform": self.platform,
                         "health": "NOMINAL",
                         "cycle": iss.pulse()
-                    })))
+                    })), self.ws_loop)
             except:
                 pass
             time.sleep(1.8)
@@ -83,7 +88,7 @@ def start(user_id="??", session="??", prompt="", meta=None):
         "input_hash": _h(str(prompt)),
         "platform": nebula.platform
     }
-    print(f"[NEBULA-START] {json.dumps(entry)}")
+    print(f"[NEBULA-START] {_dumps(entry)}")
     nebula.auto_open(str(prompt) + str(meta))
     return tx
 
@@ -97,7 +102,7 @@ def end(tx, output="", tools=None):
         "output_len": len(str(output)),
         "platform": nebula.platform
     }
-    print(f"[NEBULA-END] {json.dumps(entry)}")
+    print(f"[NEBULA-END] {_dumps(entry)}")
     nebula.auto_open(str(output))
 
 # — WebSocket Nebula Bridge (live UI anywhere)
@@ -106,7 +111,8 @@ def nebula_ws_server():
         import websockets
         async def handler(ws):
             nebula.ws = ws
-            await ws.send(json.dumps({
+            nebula.ws_loop = asyncio.get_running_loop()
+            await ws.send(_dumps({
                 "nebula": "online",
                 "platform": nebula.platform,
                 "mode": nebula.mode,
@@ -114,11 +120,11 @@ def nebula_ws_server():
             }))
             async for msg in ws:
                 try:
-                    data = json.loads(msg)
+                    data = orjson.loads(msg)
                     if data.get("cmd") == "switch":
                         nebula.switch(data["mode"])
                     elif data.get("cmd") == "status":
-                        await ws.send(json.dumps({
+                        await ws.send(_dumps({
                             "mode": nebula.mode,
                             "platform": nebula.platform,
                             "sd": iss.stardate()
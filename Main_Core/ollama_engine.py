@@ -1,74 +1,178 @@
 # ollama_engine.py — Local LLM Connector for Dual Core Caleon
-import json
+import time
+import atexit
 import asyncio
+import threading
 import aiohttp
-from typing import Dict, Any, Optional
+import orjson
+from typing import Dict, Any, Optional, AsyncIterator
 import logging
 
 logger = logging.getLogger("ollama_engine")
 
 OLLAMA_URL = "http://127.0.0.1:11434/api/generate"
+OLLAMA_TAGS_URL = "http://127.0.0.1:11434/api/tags"
 MODEL_NAME = "phi3:mini"
 
+
+def _dumps(obj: Any) -> str:
+    """orjson encoder for aiohttp's json= bodies (aiohttp expects str)"""
+    return orjson.dumps(obj).decode()
+
+
+# Shared by every OllamaEngine: one background loop thread owning one keep-alive
+# aiohttp session, plus one requests session for the sync /api/tags checks
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_session: Optional[aiohttp.ClientSession] = None
+_http = None
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared engine loop thread on first use"""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="ollama-engine-loop", daemon=True).start()
+                _loop = loop
+                atexit.register(_close_loop)
+    return _loop
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Shared keep-alive session - only ever touched on the engine loop"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(json_serialize=_dumps)
+    return _session
+
+
+def _get_tags():
+    """GET /api/tags over the shared keep-alive requests session"""
+    global _http
+    if _http is None:
+        import requests
+        _http = requests.Session()
+    return _http.get(OLLAMA_TAGS_URL, timeout=5)
+
+
+def _close_loop():
+    """Close the shared session and stop the engine loop"""
+    global _loop, _session
+    with _loop_lock:
+        loop, _loop = _loop, None
+    if loop is None:
+        return
+    if _session is not None:
+        asyncio.run_coroutine_threadsafe(_session.close(), loop).result()
+        _session = None
+    loop.call_soon_threadsafe(loop.stop)
+
+
 class OllamaEngine:
     """Local LLM reasoning engine for Caleon cognitive processes"""
 
     def __init__(self):
         self.model = MODEL_NAME
         self.timeout = 60  # seconds - increased for slower systems
+        self.health_ttl = 5.0  # seconds
+        self._health_cache = (0.0, False)  # (monotonic checked-at, healthy)
+        self._model_info_cache = (0.0, {})  # (monotonic fetched-at, model entry)
+
+    def _build_payload(self, prompt: str, system: Optional[str], stream: bool) -> Dict[str, Any]:
+        """Prepare the /api/generate request payload"""
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": stream,
+            "options": {
+                "temperature": 0.7,
+                "top_p": 0.9,
+                "num_predict": 256  # Reasonable response length
+            }
+        }
+
+        if system:
+            payload["system"] = system
+
+        return payload
+
+    async def query_stream(self, prompt: str, system: str = None) -> AsyncIterator[str]:
+        """Yield response text fragments as the model generates them"""
+        payload = self._build_payload(prompt, system, stream=True)
+
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout), json_serialize=_dumps) as session:
+            async with session.post(OLLAMA_URL, json=payload) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise RuntimeError(f"HTTP {response.status}: {error_text}")
+
+                # NDJSON - one chunk per line, the last has done=True
+                async for line in response.content:
+                    if not line.strip():
+                        continue
+                    chunk = orjson.loads(line)
+                    if "error" in chunk:
+                        raise RuntimeError(chunk["error"])
+                    if chunk.get("response"):
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        break
 
     async def query(self, prompt: str, system: str = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Query the local Ollama model with enhanced context"""
+        future = asyncio.run_coroutine_threadsafe(self._query_impl(prompt, system), _ensure_loop())
+        return await asyncio.wrap_future(future)
+
+    def query_sync(self, prompt: str, system: str = None) -> Dict[str, Any]:
+        """Blocking query for synchronous callers - no per-call event loop or session"""
+        future = asyncio.run_coroutine_threadsafe(self._query_impl(prompt, system), _ensure_loop())
+        return future.result()
+
+    async def _query_impl(self, prompt: str, system: Optional[str]) -> Dict[str, Any]:
+        """Run one /api/generate request on the engine loop"""
         try:
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                    "num_predict": 256  # Reasonable response length
-                }
-            }
+            payload = self._build_payload(prompt, system, stream=False)
 
-            if system:
-                payload["system"] = system
-
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                async with session.post(OLLAMA_URL, json=payload) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        result = {
-                            "response": data.get("response", "").strip(),
-                            "model": data.get("model", self.model),
-                            "success": True,
-                            "performance": {
-                                "total_duration": data.get("total_duration", 0),
-                                "eval_count": data.get("eval_count", 0),
-                                "eval_duration": data.get("eval_duration", 0)
-                            }
+            session = await _get_session()
+            async with session.post(OLLAMA_URL, json=payload,
+                                    timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    result = {
+                        "response": data.get("response", "").strip(),
+                        "model": data.get("model", self.model),
+                        "success": True,
+                        "performance": {
+                            "total_duration": data.get("total_duration", 0),
+                            "eval_count": data.get("eval_count", 0),
+                            "eval_duration": data.get("eval_duration", 0)
                         }
+                    }
 
-                        # Add ISS timing if available
-                        try:
-                            from .ISS_Brainstem import ISS
-                            result["iss_pulse"] = ISS.pulse()
-                            result["iss_stardate"] = ISS.stardate()
-                        except ImportError:
-                            pass
-
-                        return result
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Ollama API error: {response.status} - {error_text}")
-                        return {
-                            "response": "",
-                            "success": False,
-                            "error": f"HTTP {response.status}: {error_text}"
-                        }
+                    # Add ISS timing if available
+                    try:
+                        from .ISS_Brainstem import ISS
+                        result["iss_pulse"] = ISS.pulse()
+                        result["iss_stardate"] = ISS.stardate()
+                    except ImportError:
+                        pass
+
+                    return result
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Ollama API error: {response.status} - {error_text}")
+                    return {
+                        "response": "",
+                        "success": False,
+                        "error": f"HTTP {response.status}: {error_text}"
+                    }
 
         except asyncio.TimeoutError:
             logger.error("Ollama query timeout")
+            self.invalidate_health()
             return {
                 "response": "",
                 "success": False,
@@ -76,6 +180,7 @@ class OllamaEngine:
             }
         except Exception as e:
             logger.error(f"Ollama query failed: {e}")
+            self.invalidate_health()
             return {
                 "response": "",
                 "success": False,
@@ -83,27 +188,49 @@ class OllamaEngine:
             }
 
     def health_check(self) -> bool:
-        """Check if Ollama service is available"""
+        """Check if Ollama service is available (cached for health_ttl seconds)"""
+        checked_at, healthy = self._health_cache
+        now = time.monotonic()
+        if now - checked_at < self.health_ttl:
+            return healthy
+
         try:
-            import requests
-            response = requests.get("http://127.0.0.1:11434/api/tags", timeout=5)
-            return response.status_code == 200
+            response = _get_tags()
+            healthy = response.status_code == 200
         except:
-            return False
+            healthy = False
+        self._health_cache = (now, healthy)
+        return healthy
+
+    def invalidate_health(self):
+        """Force the next health_check / get_model_info to hit Ollama"""
+        self._health_cache = (0.0, False)
+        self._model_info_cache = (0.0, {})
+
+    def close(self):
+        """Close the shared session and stop the engine loop (affects every engine)"""
+        _close_loop()
 
     def get_model_info(self) -> Dict[str, Any]:
-        """Get information about the loaded model"""
+        """Get information about the loaded model (cached for health_ttl seconds)"""
+        fetched_at, info = self._model_info_cache
+        now = time.monotonic()
+        if now - fetched_at < self.health_ttl:
+            return info
+
+        info = {}
         try:
-            import requests
-            response = requests.get("http://127.0.0.1:11434/api/tags", timeout=5)
+            response = _get_tags()
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 for model in data.get("models", []):
                     if model["name"] == self.model:
-                        return model
-            return {}
+                        info = model
+                        break
         except:
-            return {}
+            pass
+        self._model_info_cache = (now, info)
+        return info
 
 # Global instance for use throughout Caleon
 ollama_engine = OllamaEngine()
\ No newline at end of file
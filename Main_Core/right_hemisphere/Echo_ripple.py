@@ -16,7 +16,9 @@
 # --------------------------------------------------------------------
 
 import json
+import orjson
 import random
+import functools
 import time
 from pathlib import Path
 from typing import Dict, Any
@@ -29,14 +31,15 @@ try:
 except ImportError:
     class VaultAPI:
         @staticmethod
+        @functools.lru_cache(maxsize=64)  # seeds are parsed once; read_seed.cache_clear() reloads
         def read_seed(name: str) -> Dict[str, Any]:
             p = Path(f"vaults/core/seed/{name}.json")
-            return json.loads(p.read_text()) if p.exists() else {}
+            return orjson.loads(p.read_bytes()) if p.exists() else {}
 
         @staticmethod
         def write_reflection(name: str, data: Dict[str, Any]):
             p = Path(f"vaults/core/reflection/{name}.json")
-            p.write_text(json.dumps(data, indent=2))
+            p.write_bytes(orjson.dumps(data))
 
 
 # -------------------------------------------------------------
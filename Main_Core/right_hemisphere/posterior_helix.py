@@ -12,14 +12,23 @@
 
 import time
 import json
+import orjson
 import random
+import functools
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # -------------------------------------------------------------
 # ISS Brainstem Integration
 # -------------------------------------------------------------
 from ..ISS_Brainstem import ISS, List
+from ..vault_writer import vault_writer
+from ..helix_sync import posterior_ready
 
 # -------------------------------------------------------------
 # Unified Vault API (global single vault system)
@@ -29,14 +38,15 @@ try:
 except ImportError:
     class VaultAPI:
         @staticmethod
+        @functools.lru_cache(maxsize=64)  # seeds are parsed once; read_seed.cache_clear() reloads
         def read_seed(name: str) -> Dict[str, Any]:
             p = Path(f"vaults/core/seed/{name}.json")
-            return json.loads(p.read_text()) if p.exists() else {}
+            return orjson.loads(p.read_bytes()) if p.exists() else {}
 
         @staticmethod
         def write_reflection(name: str, data: Dict[str, Any]):
             p = Path(f"vaults/core/reflection/{name}.json")
-            p.write_text(json.dumps(data, indent=2))
+            p.write_bytes(orjson.dumps(data))
 
 
 # -------------------------------------------------------------
@@ -70,9 +80,17 @@ class PosteriorPituitaryHelix:
         "seed_hedonic_reflex"
     ]
 
+    # Upper bound on recursive passes (5 main + 5 conflict passes)
+    MAX_CYCLES = 10
+
     def __init__(self, hemisphere: str):
         self.hemisphere = hemisphere
         self._reflection_index = 0
+        self._rng = np.random.default_rng() if np is not None else None
+
+        # Idle until process() runs - lets this hemisphere's Anterior Helix skip its lead wait
+        self._ready = posterior_ready(hemisphere)
+        self._ready.set()
 
     # ---------------------------------------------------------
     # Entry point
@@ -83,17 +101,25 @@ class PosteriorPituitaryHelix:
             A single subconscious verdict packet, OR
             Escalates unresolved conflict to Gyro Cortical Harmonizer.
         """
+        self._ready.clear()
+        try:
+            return self._process(anterior_packet)
+        finally:
+            self._ready.set()
 
+    def _process(self, anterior_packet: Dict[str, Any]) -> Dict[str, Any]:
         results = []
         conflicts = 0
+        draws = self._draw_cycle_sets()
 
+        prev = None
         for cycle in range(1, 6):  # main 5 cycles
-            verdict = self._cycle_logic(anterior_packet, cycle)
+            verdict = self._cycle_logic(anterior_packet, cycle, draws)
             results.append(verdict)
 
-            if cycle > 1:
-                if not self._within_tolerance(results[-1], results[-2]):
-                    conflicts += 1
+            if prev is not None and not self._within_tolerance(verdict, prev):
+                conflicts += 1
+            prev = verdict
 
         # -----------------------------------------------------
         # Additional conflict passes (up to 10 total)
@@ -101,16 +127,17 @@ class PosteriorPituitaryHelix:
         if conflicts > 0:
             for extra in range(6, 11):
                 time.sleep(0.010)  # 10ms delay per ICS-V2
-                verdict = self._cycle_logic(anterior_packet, extra)
+                verdict = self._cycle_logic(anterior_packet, extra, draws)
                 results.append(verdict)
 
-                if self._within_tolerance(results[-1], results[-2]):
+                if self._within_tolerance(verdict, prev):
                     break  # Conflict resolved early
+                prev = verdict
 
         # -----------------------------------------------------
         # Final verdict or escalation
         # -----------------------------------------------------
-        final = results[-1]
+        final = verdict
 
         if conflicts > 0 and not self._stability_check(results):
             # Escalate to harmonizer
@@ -139,14 +166,32 @@ class PosteriorPituitaryHelix:
         self._log_reflection(packet)
         return packet
 
+    # ---------------------------------------------------------
+    # Per-process philosopher / logic draws
+    # ---------------------------------------------------------
+    def _draw_cycle_sets(self) -> List[Tuple[int, List[int]]]:
+        """Draw (philosopher index, 4 logic indices) for every possible cycle in one batch."""
+        n = self.MAX_CYCLES
+        if self._rng is None:
+            logic_range = range(len(self.LOGIC_SEEDS))
+            return [(random.randrange(len(self.PHILOSOPHERS)), random.sample(logic_range, 4))
+                    for _ in range(n)]
+
+        phil_idx = self._rng.integers(0, len(self.PHILOSOPHERS), size=n)
+        # Row-wise shuffles of 0..L-1; the first 4 columns are draws without replacement
+        logic_idx = self._rng.permuted(np.tile(np.arange(len(self.LOGIC_SEEDS)), (n, 1)), axis=1)[:, :4]
+        return list(zip(phil_idx.tolist(), logic_idx.tolist()))
+
     # ---------------------------------------------------------
     # Single recursive pass logic
     # ---------------------------------------------------------
-    def _cycle_logic(self, anterior_packet: Dict[str, Any], cycle_number: int) -> float:
+    def _cycle_logic(self, anterior_packet: Dict[str, Any], cycle_number: int,
+                     draws: List[Tuple[int, List[int]]]) -> float:
         """One subconscious recursion using randomized logic/philosophy sets."""
 
-        philosopher = random.choice(self.PHILOSOPHERS)
-        logic_seeds = random.sample(self.LOGIC_SEEDS, 4)
+        phil_i, logic_i = draws[cycle_number - 1]
+        philosopher = self.PHILOSOPHERS[phil_i]
+        logic_seeds = [self.LOGIC_SEEDS[i] for i in logic_i]
 
         # Load philosopher seed
         pseed = VaultAPI.read_seed(philosopher)
@@ -171,7 +216,7 @@ class PosteriorPituitaryHelix:
         }
 
         rid = f"{self.hemisphere}_posterior_cycle_{self._reflection_index:06d}"
-        VaultAPI.write_reflection(rid, reflection)
+        vault_writer.append(f"{self.hemisphere}_posterior_cycles", rid, reflection)
         self._reflection_index += 1
 
         return subconscious_value
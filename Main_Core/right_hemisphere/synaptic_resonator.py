@@ -9,7 +9,9 @@
 #   cognitive verdict for downstream modules.
 
 import json
+import orjson
 import random
+import functools
 import time
 from pathlib import Path
 from typing import List, Dict, Any
@@ -18,52 +20,74 @@ from typing import List, Dict, Any
 # ISS Brainstem Integration
 # -------------------------------------------------------------
 from ..ISS_Brainstem import ISS
+from ..vault_writer import vault_writer
 try:
     from core.vault_api import VaultAPI
 except ImportError:
     class VaultAPI:
         @staticmethod
+        @functools.lru_cache(maxsize=64)  # seeds are parsed once; read_seed.cache_clear() reloads
         def read_seed(name: str):
             p = Path(f"vaults/core/seed/{name}.json")
-            return json.loads(p.read_text()) if p.exists() else {}
+            return orjson.loads(p.read_bytes()) if p.exists() else {}
 
         @staticmethod
         def write_reflection(name: str, data: Dict[str, Any]):
             p = Path(f"vaults/core/reflection/{name}.json")
-            p.write_text(json.dumps(data, indent=2))
+            p.write_bytes(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
 
 # -------------------------------------------------------------
-# Synaptic Reasoning Units
+# Optional JIT resonance kernel (falls back to one vectorized NumPy draw,
+# then to a plain Python pass over the synapse lists)
 # -------------------------------------------------------------
-class Synapse:
-    """One synapse with one of three reasoning modes."""
-
-    def __init__(self, mode: str, vault_seed: Dict[str, Any]):
-        self.mode = mode
-        self.bias = vault_seed.get("bias", 0.0)
-        self.mod = vault_seed.get("mod", 0.02)
-
-    def fire(self, incoming: float) -> float:
-        """Applies synaptic modification based on reasoning type."""
-        if self.mode == "intuition":      # Spinoza-type
-            return incoming * (1.0 + self.bias + random.uniform(-self.mod, self.mod))
-        if self.mode == "induction":      # Hume-type
-            return incoming * (1.0 + random.uniform(-self.mod * 2, self.mod * 2))
-        if self.mode == "deduction":      # Kant/Locke formal logic
-            return incoming * (1.0 + random.uniform(-self.mod, self.mod/2))
-        return incoming
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+MODE_CODES = {"intuition": 0, "induction": 1, "deduction": 2}
+SYNAPSES_PER_MODE = 780
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _resonate_kernel(incoming: float, fire_bias, lo, hi):
+        """
+        Fire every synapse and distill the pyramid in one pass -
+        same rules as SynapticResonator._fire_all + _fan_pass.
+        Returns node outputs in NODES order (6, 5, 4, 3, 2, 1).
+        """
+        third = fire_bias.shape[0] // 3
+        out = np.empty(6)
+        for k in range(3):         # nodes 6, 5, 4 - one 780-synapse slice each
+            total = 0.0
+            for i in range(k * third, (k + 1) * third):
+                total += incoming * (1.0 + fire_bias[i] + np.random.uniform(lo[i], hi[i]))
+            out[k] = total / third
+        out[3] = (out[0] + out[1] + out[2]) / 3.0   # node 3
+        out[4] = out[3]                              # node 2 - same inputs as node 3
+        out[5] = (out[3] + out[4]) / 2.0             # node 1
+        return out
 
 # -------------------------------------------------------------
 # Pyramid Node
 # -------------------------------------------------------------
 class PyramidNode:
+    __slots__ = ("node_id",)
+
     def __init__(self, node_id: int):
         self.node_id = node_id
 
     def aggregate(self, values: List[float]) -> float:
-        """Distill list into single verdict."""
-        if not values:
+        """Distill list (or array) into single verdict."""
+        if len(values) == 0:
             return 1.0
+        if np is not None and isinstance(values, np.ndarray):
+            return float(values.mean())
         # weighted harmonic-mean style distillation
         return sum(values) / len(values)
 
@@ -90,18 +114,60 @@ class SynapticResonator:
 
     # ---------------------------------------------------------
     def _build_synapses(self):
-        """Allocate 2,340 synapses (780 each)."""
-        self.synapses: List[Synapse] = []
+        """
+        Allocate 2,340 synapses (780 each) as flat per-synapse arrays.
+        Every synapse fires as incoming * (1 + fire_bias + uniform(lo, hi)).
+        """
+        i_mod = self.intuitive_seed.get("mod", 0.02)
+        h_mod = self.inductive_seed.get("mod", 0.02)
+        d_mod = self.deductive_seed.get("mod", 0.02)
+
+        # (fire_bias, lo, hi) per reasoning mode, indexed by MODE_CODES
+        rules = (
+            (self.intuitive_seed.get("bias", 0.0), -i_mod, i_mod),   # intuition: Spinoza-type
+            (0.0, -2.0 * h_mod, 2.0 * h_mod),                          # induction: Hume-type
+            (0.0, -d_mod, d_mod / 2),                                  # deduction: Kant/Locke formal logic
+        )
+
+        if np is not None:
+            self._rng = np.random.default_rng()
+            self._modes = self._rng.permutation(
+                np.repeat(np.arange(len(rules), dtype=np.int8), SYNAPSES_PER_MODE))
+            fire_bias, lo, hi = (np.array(col, dtype=np.float64) for col in zip(*rules))
+            self._fire_bias = fire_bias[self._modes]
+            self._lo = lo[self._modes]
+            self._hi = hi[self._modes]
+        else:
+            self._modes = list(range(len(rules))) * SYNAPSES_PER_MODE
+            random.shuffle(self._modes)
+            self._fire_bias, self._lo, self._hi = (
+                [col[m] for m in self._modes] for col in zip(*rules))
 
-        for _ in range(780):
-            self.synapses.append(Synapse("intuition", self.intuitive_seed))
-            self.synapses.append(Synapse("induction", self.inductive_seed))
-            self.synapses.append(Synapse("deduction", self.deductive_seed))
+    # ---------------------------------------------------------
+    def _pyramid(self, stimulus_value: float) -> Dict[int, float]:
+        """Fire all synapses and distill them into the pyramid node outputs."""
+        if njit is not None:
+            outs = _resonate_kernel(stimulus_value, self._fire_bias, self._lo, self._hi)
+            return dict(zip(self.NODES, outs.tolist()))
+        return self._fan_pass(self._fire_all(stimulus_value))
 
-        random.shuffle(self.synapses)
+    # ---------------------------------------------------------
+    def _fire_all(self, stimulus_value: float):
+        """Fire all synapses for one stimulus (ndarray when NumPy is available)."""
+        if np is not None:
+            noise = self._rng.uniform(self._lo, self._hi)
+            return stimulus_value * (1.0 + self._fire_bias + noise)
+        uniform = random.uniform
+        return [stimulus_value * (1.0 + b + uniform(lo, hi))
+                for b, lo, hi in zip(self._fire_bias, self._lo, self._hi)]
+
+    # ---------------------------------------------------------
+    def warmup(self):
+        """Compile (or load cached) resonance kernel ahead of the first real cycle."""
+        self._pyramid(0.0)
 
     # ---------------------------------------------------------
-    def _fan_pass(self, values: List[float]) -> Dict[int, float]:
+    def _fan_pass(self, values) -> Dict[int, float]:
         """Distribute into pyramid nodes as ICS-V2 specifies."""
         # 6 receives 780 inputs
         # 5 receives 780 inputs
@@ -135,9 +201,7 @@ class SynapticResonator:
           2340 synapses fire → grouped → pyramid → final verdict
         """
 
-        fired = [syn.fire(stimulus_value) for syn in self.synapses]
-
-        pyramid_out = self._fan_pass(fired)
+        pyramid_out = self._pyramid(stimulus_value)
 
         final_verdict = pyramid_out[1]
 
@@ -161,7 +225,7 @@ class SynapticResonator:
     # ---------------------------------------------------------
     def _log(self, data: Dict[str, Any]):
         rid = f"{self.hemisphere}_syn_res_{self.ref_count:06d}"
-        VaultAPI.write_reflection(rid, data)
+        vault_writer.append(f"{self.hemisphere}_syn_res", rid, dict(data))
         self.ref_count += 1
 
 
@@ -0,0 +1,76 @@
+# vault_writer.py — Background Reflection Writer for Dual Core Caleon
+# Keeps vault reflection I/O off the reasoning path: hemisphere modules
+# enqueue (writer, id, packet) and one daemon thread performs the writes in order.
+# High-frequency traces go to append-only JSONL streams instead of one file each.
+import atexit
+import queue
+import logging
+import functools
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict
+
+import orjson
+
+logger = logging.getLogger("vault_writer")
+
+WriteFn = Callable[[str, Dict[str, Any]], None]
+
+REFLECTION_DIR = Path("vaults/core/reflection")
+STREAM_BUFFER = 1 << 16
+
+
+class VaultWriter:
+    """Single FIFO writer thread shared by every reflection logger."""
+
+    def __init__(self, name: str = "vault-writer"):
+        self._queue = queue.Queue()
+        self._streams: Dict[str, BinaryIO] = {}  # only touched on the writer thread
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def submit(self, write: WriteFn, rid: str, data: Dict[str, Any]):
+        """Queue one reflection; `write` is the caller's VaultAPI.write_reflection."""
+        self._queue.put((write, rid, data))
+
+    def append(self, stream: str, rid: str, data: Dict[str, Any]):
+        """Queue one reflection as a line of vaults/core/reflection/<stream>.jsonl"""
+        self._queue.put((functools.partial(self._append_line, stream), rid, data))
+
+    def flush(self):
+        """Block until every queued reflection has been written."""
+        self._queue.join()
+
+    def _append_line(self, stream: str, rid: str, data: Dict[str, Any]):
+        fh = self._streams.get(stream)
+        if fh is None:
+            REFLECTION_DIR.mkdir(parents=True, exist_ok=True)
+            fh = open(REFLECTION_DIR / f"{stream}.jsonl", "ab", buffering=STREAM_BUFFER)
+            self._streams[stream] = fh
+        # rid first so each line stands alone for vault readers
+        fh.write(orjson.dumps({"rid": rid, **data}, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+
+    def _flush_streams(self):
+        for stream, fh in self._streams.items():
+            try:
+                fh.flush()
+            except OSError:
+                logger.exception("Reflection stream flush failed: %s", stream)
+
+    def _run(self):
+        while True:
+            write, rid, data = self._queue.get()
+            try:
+                write(rid, data)
+            except Exception:
+                logger.exception("Reflection write failed: %s", rid)
+            finally:
+                # Streams are flushed whenever the backlog drains (and so before flush() returns)
+                if self._queue.empty():
+                    self._flush_streams()
+                self._queue.task_done()
+
+
+# Global instance
+vault_writer = VaultWriter()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Gyro Harmonizer Test - Seed Set Selection & Cycle Numbering
+Tests both hemisphere harmonizers against a stub vault
+"""
+
+import sys
+import os
+import random
+import threading
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from Main_Core.left_hemisphere.gyro_harmonizer import HarmonizerLeft
+from Main_Core.right_hemisphere.gyro_harmonizer import HarmonizerRight
+
+HARMONIZERS = (HarmonizerLeft, HarmonizerRight)
+
+
+class StubVault:
+    """Minimal vault: resolves on the Nth evaluate() call (never if resolve_on is None)"""
+
+    def __init__(self, philosophers, logic_seeds, resolve_on=None):
+        self.philosophers = philosophers
+        self.logic_seeds = logic_seeds
+        self.resolve_on = resolve_on
+        self.calls = []
+
+    def evaluate(self, distilled, philosopher, logic_set):
+        self.calls.append((philosopher, logic_set))
+        return len(self.calls)
+
+    def is_resolved(self, verdict):
+        return verdict == self.resolve_on
+
+
+def test_saturated_window_does_not_hang():
+    """1 philosopher x 5 logic seeds = a single combo; repeated picks must still return"""
+    for cls in HARMONIZERS:
+        vault = StubVault(["seed_kant"], ["l0", "l1", "l2", "l3", "l4"])
+        harmonizer = cls(vault)
+        picks = []
+
+        worker = threading.Thread(
+            target=lambda: picks.extend(harmonizer._pick_unique_seedset() for _ in range(25)),
+            daemon=True
+        )
+        worker.start()
+        worker.join(timeout=2.0)
+
+        assert not worker.is_alive(), f"{cls.__name__}: _pick_unique_seedset hung"
+        assert picks == [("seed_kant", ("l0", "l1", "l2", "l3", "l4"))] * 25
+        assert len(harmonizer.previous_sets) == 1
+
+
+def test_names_match_sampled_indices():
+    """Returned logic names are exactly the sampled indices' seeds, sorted"""
+    philosophers = ["seed_kant", "seed_hume", "seed_locke"]
+    logic_seeds = [f"logic_{c}" for c in "hgfedcba"]  # unsorted on purpose
+
+    for cls in HARMONIZERS:
+        harmonizer = cls(StubVault(philosophers, logic_seeds))
+        for seed in range(50):
+            random.seed(seed)
+            expected_phil = random.choice(philosophers)
+            expected_logic = tuple(sorted(logic_seeds[i] for i in random.sample(range(len(logic_seeds)), 5)))
+
+            harmonizer.previous_sets.clear()
+            harmonizer._previous_order.clear()
+            random.seed(seed)
+            assert harmonizer._pick_unique_seedset() == (expected_phil, expected_logic), cls.__name__
+
+
+def test_cycle_numbering():
+    """cycles counts base + conflict passes 1..10; unresolved reports all 10"""
+    philosophers = ["seed_kant", "seed_hume"]
+    logic_seeds = [f"logic_{i}" for i in range(8)]
+
+    for cls in HARMONIZERS:
+        for resolve_on in range(1, 11):
+            vault = StubVault(philosophers, logic_seeds, resolve_on)
+            result = cls(vault).harmonize({})
+            assert result["status"] == "resolved"
+            assert result["cycles"] == resolve_on
+            assert len(vault.calls) == resolve_on
+            assert len(set(vault.calls)) == resolve_on  # no seed set repeated
+
+        vault = StubVault(philosophers, logic_seeds)
+        result = cls(vault).harmonize({})
+        assert result["status"] == "unresolved"
+        assert result["cycles"] == 10
+        assert len(vault.calls) == 10
+
+
+if __name__ == "__main__":
+    print("🧭 Testing Gyro Harmonizers")
+    print("=" * 60)
+    for test in (test_saturated_window_does_not_hang, test_names_match_sampled_indices, test_cycle_numbering):
+        test()
+        print(f"✅ {test.__name__}")
+    print("=" * 60)
+    print("All harmonizer tests passed")